@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -115,6 +116,26 @@ def validate_email(email: str) -> bool:
     return bool(EMAIL_REGEX.match(email.strip()))
 
 
+def _normalize_email(email: str, error: str) -> str:
+    """Strip, validate and lowercase an email field in one pass.
+
+    Args:
+        email: Raw email value from the model input
+        error: Message for the ValueError raised on an invalid email
+
+    Returns:
+        The trimmed, lowercased email
+
+    Raises:
+        ValueError: If the email format is invalid
+    """
+    if isinstance(email, str):
+        email = email.strip()
+        if EMAIL_REGEX.match(email):
+            return email.lower()
+    raise ValueError(error)
+
+
 def validate_non_empty_string(value: str, field_name: str) -> str:
     """Validate that a string is non-empty.
 
@@ -136,6 +157,11 @@ def validate_non_empty_string(value: str, field_name: str) -> str:
     return trimmed
 
 
+# 5-100 characters once surrounding whitespace is ignored, checked in one match
+# without building a stripped copy.
+CAMPAIGN_ID_REGEX = re.compile(r"\s*\S.{3,98}\S\s*", re.DOTALL)
+
+
 def validate_campaign_id(campaign_id: str) -> bool:
     """Validate Instantly campaign ID format.
 
@@ -145,10 +171,7 @@ def validate_campaign_id(campaign_id: str) -> bool:
     Returns:
         True if format looks valid, False otherwise
     """
-    if not campaign_id or not isinstance(campaign_id, str):
-        return False
-    trimmed = campaign_id.strip()
-    return len(trimmed) >= 5 and len(trimmed) <= 100
+    return isinstance(campaign_id, str) and bool(CAMPAIGN_ID_REGEX.fullmatch(campaign_id))
 
 
 def validate_account_email(email: str) -> bool:
@@ -174,9 +197,7 @@ def validate_limit(limit: int, default: int = 100, max_limit: int = 100) -> int:
     Returns:
         Validated limit value
     """
-    if not isinstance(limit, int) or limit <= 0:
-        return default
-    return min(limit, max_limit)
+    return min(limit, max_limit) if isinstance(limit, int) and limit > 0 else default
 
 
 def validate_skip(skip: int) -> int:
@@ -188,9 +209,7 @@ def validate_skip(skip: int) -> int:
     Returns:
         Validated skip value (minimum 0)
     """
-    if not isinstance(skip, int) or skip < 0:
-        return 0
-    return skip
+    return skip if isinstance(skip, int) and skip > 0 else 0
 
 
 # =============================================================================
@@ -213,9 +232,7 @@ class LeadInput(BaseModel):
     @field_validator("email")
     @classmethod
     def validate_email_format(cls, v: str) -> str:
-        if not validate_email(v):
-            raise ValueError("Invalid email format")
-        return v.strip().lower()
+        return _normalize_email(v, "Invalid email format")
 
 
 class BulkLeadInput(BaseModel):
@@ -242,9 +259,7 @@ class CampaignInput(BaseModel):
     @field_validator("from_email")
     @classmethod
     def validate_from_email(cls, v: str) -> str:
-        if not validate_email(v):
-            raise ValueError("Invalid from_email format")
-        return v.strip().lower()
+        return _normalize_email(v, "Invalid from_email format")
 
 
 class EmailReplyInput(BaseModel):
@@ -258,9 +273,7 @@ class EmailReplyInput(BaseModel):
     @field_validator("email")
     @classmethod
     def validate_email_format(cls, v: str) -> str:
-        if not validate_email(v):
-            raise ValueError("Invalid email format")
-        return v.strip().lower()
+        return _normalize_email(v, "Invalid email format")
 
     @field_validator("campaign_id")
     @classmethod
@@ -298,14 +311,26 @@ class InstantlyErrorType(str, Enum):
     @classmethod
     def is_retriable(cls, error_type: "InstantlyErrorType") -> bool:
         """Check if an error type should be retried."""
-        return error_type in {
-            cls.RATE_LIMITED,
-            cls.NETWORK_ERROR,
-            cls.TIMEOUT,
-            cls.SERVICE_UNAVAILABLE,
-        }
+        return error_type in _RETRIABLE_ERROR_TYPES
+
+
+_RETRIABLE_ERROR_TYPES: frozenset[InstantlyErrorType] = frozenset(
+    {
+        InstantlyErrorType.RATE_LIMITED,
+        InstantlyErrorType.NETWORK_ERROR,
+        InstantlyErrorType.TIMEOUT,
+        InstantlyErrorType.SERVICE_UNAVAILABLE,
+    }
+)
 
 
+# Body patterns for the 4xx branches of classify_http_error, each matched in a
+# single pass over the lowercased message.
+_LEAD_EXISTS_PATTERN = re.compile(r"already exists|duplicate")
+_CAMPAIGN_INACTIVE_PATTERN = re.compile(r"not active|paused")
+
+
+@lru_cache(maxsize=1024)
 def classify_http_error(status_code: int, error_message: str = "") -> InstantlyErrorType:
     """Classify HTTP status code into error type.
 
@@ -315,9 +340,10 @@ def classify_http_error(status_code: int, error_message: str = "") -> InstantlyE
 
     Returns:
         InstantlyErrorType classification
-    """
-    error_lower = error_message.lower()
 
+    Results are memoized, since retries and bulk lead submissions tend to
+    repeat the same status and message.
+    """
     if status_code == 401:
         return InstantlyErrorType.AUTHENTICATION
     elif status_code == 403:
@@ -325,7 +351,7 @@ def classify_http_error(status_code: int, error_message: str = "") -> InstantlyE
     elif status_code == 404:
         return InstantlyErrorType.NOT_FOUND
     elif status_code == 409:
-        if "already exists" in error_lower or "duplicate" in error_lower:
+        if _LEAD_EXISTS_PATTERN.search(error_message.lower()):
             return InstantlyErrorType.LEAD_EXISTS
         return InstantlyErrorType.BAD_REQUEST
     elif status_code == 422:
@@ -333,7 +359,8 @@ def classify_http_error(status_code: int, error_message: str = "") -> InstantlyE
     elif status_code == 429:
         return InstantlyErrorType.RATE_LIMITED
     elif status_code >= 400 and status_code < 500:
-        if "campaign" in error_lower and ("not active" in error_lower or "paused" in error_lower):
+        error_lower = error_message.lower()
+        if "campaign" in error_lower and _CAMPAIGN_INACTIVE_PATTERN.search(error_lower):
             return InstantlyErrorType.CAMPAIGN_NOT_ACTIVE
         if "account" in error_lower:
             return InstantlyErrorType.ACCOUNT_ERROR
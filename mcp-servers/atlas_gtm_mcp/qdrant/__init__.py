@@ -16,7 +16,7 @@ import re
 import time
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
@@ -26,22 +26,24 @@ from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
 from .embeddings import EmbeddingError, embed_batch, embed_document, embed_query
 from .logging import log_tool_error, log_tool_result
 from .models import (
+    BRAIN_STATUS_BY_VALUE,
+    CONTENT_TYPE_BY_VALUE,
+    ICP_CATEGORY_BY_VALUE,
+    IMPORTANCE_BY_VALUE,
+    INSIGHT_CATEGORY_BY_VALUE,
+    REPLY_TYPE_BY_VALUE,
     VALID_TRANSITIONS,
     BrainStatus,
-    ContentType,
-    ICPCategory,
-    Importance,
-    InsightCategory,
-    ReplyType,
     SeedingError,
     SeedingResult,
     SourceMetadata,
     ValidationStatus,
     generate_point_id,
+    generate_point_id_fast,
     validate_brain_id,
     validate_status_transition,
 )
-from .quality_gates import run_quality_gate
+from .quality_gates import forget_brain, remember_insight, run_quality_gate
 
 if TYPE_CHECKING:
     pass
@@ -50,6 +52,9 @@ if TYPE_CHECKING:
 # Thresholds per spec
 OBJECTION_CONFIDENCE_THRESHOLD = 0.70  # FR-012
 
+_VERTICAL_PATTERN = re.compile(r"^[a-z][a-z0-9_-]*$")
+_NON_ATTRIBUTE_CHARS = re.compile(r"[^a-zA-Z0-9\s]")
+
 
 def _get_qdrant_client() -> QdrantClient:
     """Get Qdrant client instance."""
@@ -189,7 +194,7 @@ def _derive_attribute(name: str) -> str:
     if not name:
         return ""
     # Remove non-alphanumeric characters except spaces
-    cleaned = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+    cleaned = _NON_ATTRIBUTE_CHARS.sub("", name)
     # Convert to snake_case
     return '_'.join(cleaned.lower().split())
 
@@ -337,6 +342,35 @@ async def _validate_brain_seedable(brain_id: str) -> dict:
     return brain_data
 
 
+class _RawSeedingError(NamedTuple):
+    """Seeding error collected inside the item loop (see SeedingError)."""
+
+    index: int
+    name: str
+    error: str
+
+
+def _build_seeding_result(
+    brain_id: str,
+    collection: str,
+    seeded_count: int,
+    errors: list[_RawSeedingError],
+    message: str,
+) -> SeedingResult:
+    """Build a SeedingResult from internally produced values.
+
+    Everything here is produced by _seed_items_to_collection itself, so
+    validation is skipped with model_construct.
+    """
+    return SeedingResult.model_construct(
+        brain_id=brain_id,
+        collection=collection,
+        seeded_count=seeded_count,
+        errors=[SeedingError.model_construct(**e._asdict()) for e in errors],
+        message=message,
+    )
+
+
 async def _seed_items_to_collection(
     brain_id: str,
     items: list[dict],
@@ -360,7 +394,7 @@ async def _seed_items_to_collection(
         SeedingResult with seeded_count and any errors.
     """
     if not items:
-        return SeedingResult(
+        return _build_seeding_result(
             brain_id=brain_id,
             collection=collection,
             seeded_count=0,
@@ -371,7 +405,7 @@ async def _seed_items_to_collection(
     # Validate brain is seedable first
     await _validate_brain_seedable(brain_id)
 
-    errors: list[SeedingError] = []
+    errors: list[_RawSeedingError] = []
     valid_items: list[tuple[int, dict, str]] = []  # (index, item, text_to_embed)
 
     # Validate items and extract text to embed
@@ -382,11 +416,7 @@ async def _seed_items_to_collection(
         text_to_embed = item.get(embed_field)
         if not text_to_embed:
             errors.append(
-                SeedingError(
-                    index=idx,
-                    name=str(item_name),
-                    error=f"Missing required field: {embed_field}",
-                )
+                _RawSeedingError(idx, str(item_name), f"Missing required field: {embed_field}")
             )
             continue
 
@@ -394,18 +424,14 @@ async def _seed_items_to_collection(
         key_value = item.get(key_field)
         if not key_value:
             errors.append(
-                SeedingError(
-                    index=idx,
-                    name=str(item_name),
-                    error=f"Missing required field: {key_field}",
-                )
+                _RawSeedingError(idx, str(item_name), f"Missing required field: {key_field}")
             )
             continue
 
         valid_items.append((idx, item, str(text_to_embed)))
 
     if not valid_items:
-        return SeedingResult(
+        return _build_seeding_result(
             brain_id=brain_id,
             collection=collection,
             seeded_count=0,
@@ -429,10 +455,11 @@ async def _seed_items_to_collection(
     # Build points for upsert
     points: list[PointStruct] = []
     timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    brain_id_bytes = brain_id.encode()
 
     for embedding_idx, (item_idx, item, _) in enumerate(valid_items):
         key_value = item.get(key_field)
-        point_id = generate_point_id(brain_id, str(key_value))
+        point_id = generate_point_id_fast(brain_id_bytes, str(key_value))
 
         # Build payload with brain_id scope
         payload = {
@@ -465,7 +492,7 @@ async def _seed_items_to_collection(
     else:
         message = f"Successfully seeded {seeded_count} items"
 
-    return SeedingResult(
+    return _build_seeding_result(
         brain_id=brain_id,
         collection=collection,
         seeded_count=seeded_count,
@@ -522,12 +549,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if limit < 1 or limit > 50:
                 raise ToolError("Limit must be between 1 and 50")
 
-            if category is not None:
-                try:
-                    ICPCategory(category)
-                except ValueError:
-                    valid_categories = ", ".join([c.value for c in ICPCategory])
-                    raise ToolError(f"Invalid category: {category}. Valid: {valid_categories}")
+            if category is not None and category not in ICP_CATEGORY_BY_VALUE:
+                valid_categories = ", ".join(ICP_CATEGORY_BY_VALUE)
+                raise ToolError(f"Invalid category: {category}. Valid: {valid_categories}")
 
             # Build filter
             must_conditions = [
@@ -617,10 +641,8 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if not validate_brain_id(brain_id):
                 raise ToolError(f"Invalid brain_id format: {brain_id}")
 
-            try:
-                ReplyType(reply_type)
-            except ValueError:
-                valid_types = ", ".join([r.value for r in ReplyType])
+            if reply_type not in REPLY_TYPE_BY_VALUE:
+                valid_types = ", ".join(REPLY_TYPE_BY_VALUE)
                 raise ToolError(f"Invalid reply_type: {reply_type}. Valid: {valid_types}")
 
             if tier is not None and (tier < 1 or tier > 3):
@@ -800,12 +822,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if limit < 1 or limit > 20:
                 raise ToolError("Limit must be between 1 and 20")
 
-            if content_type is not None:
-                try:
-                    ContentType(content_type)
-                except ValueError:
-                    valid_types = ", ".join([c.value for c in ContentType])
-                    raise ToolError(f"Invalid content_type: {content_type}. Valid: {valid_types}")
+            if content_type is not None and content_type not in CONTENT_TYPE_BY_VALUE:
+                valid_types = ", ".join(CONTENT_TYPE_BY_VALUE)
+                raise ToolError(f"Invalid content_type: {content_type}. Valid: {valid_types}")
 
             # Build filter
             must_conditions = [
@@ -888,12 +907,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if limit < 1 or limit > 1000:
                 raise ToolError("Limit must be between 1 and 1000")
 
-            if category is not None:
-                try:
-                    ICPCategory(category)
-                except ValueError:
-                    valid_categories = ", ".join([c.value for c in ICPCategory])
-                    raise ToolError(f"Invalid category: {category}. Valid: {valid_categories}")
+            if category is not None and category not in ICP_CATEGORY_BY_VALUE:
+                valid_categories = ", ".join(ICP_CATEGORY_BY_VALUE)
+                raise ToolError(f"Invalid category: {category}. Valid: {valid_categories}")
 
             # Build filter
             must_conditions = [
@@ -977,12 +993,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if limit < 1 or limit > 1000:
                 raise ToolError("Limit must be between 1 and 1000")
 
-            if reply_type is not None:
-                try:
-                    ReplyType(reply_type)
-                except ValueError:
-                    valid_types = ", ".join([r.value for r in ReplyType])
-                    raise ToolError(f"Invalid reply_type: {reply_type}. Valid: {valid_types}")
+            if reply_type is not None and reply_type not in REPLY_TYPE_BY_VALUE:
+                valid_types = ", ".join(REPLY_TYPE_BY_VALUE)
+                raise ToolError(f"Invalid reply_type: {reply_type}. Valid: {valid_types}")
 
             # Build filter
             must_conditions = [
@@ -1147,12 +1160,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if limit < 1 or limit > 1000:
                 raise ToolError("Limit must be between 1 and 1000")
 
-            if content_type is not None:
-                try:
-                    ContentType(content_type)
-                except ValueError:
-                    valid_types = ", ".join([c.value for c in ContentType])
-                    raise ToolError(f"Invalid content_type: {content_type}. Valid: {valid_types}")
+            if content_type is not None and content_type not in CONTENT_TYPE_BY_VALUE:
+                valid_types = ", ".join(CONTENT_TYPE_BY_VALUE)
+                raise ToolError(f"Invalid content_type: {content_type}. Valid: {valid_types}")
 
             # Build filter
             must_conditions = [
@@ -1254,15 +1264,13 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             if len(content) > 5000:
                 raise ToolError("Insight content exceeds 5000 characters")
 
-            try:
-                InsightCategory(category)
-            except ValueError:
-                valid_categories = ", ".join([c.value for c in InsightCategory])
+            insight_category = INSIGHT_CATEGORY_BY_VALUE.get(category)
+            if insight_category is None:
+                valid_categories = ", ".join(INSIGHT_CATEGORY_BY_VALUE)
                 raise ToolError(f"Invalid category: {category}. Valid: {valid_categories}")
 
-            try:
-                Importance(importance)
-            except ValueError:
+            insight_importance = IMPORTANCE_BY_VALUE.get(importance)
+            if insight_importance is None:
                 raise ToolError("Importance must be: low, medium, or high")
 
             # Validate source
@@ -1285,11 +1293,11 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             )
 
             # Run quality gates
-            gate_result = run_quality_gate(
+            gate_result = await run_quality_gate(
                 brain_id=brain_id,
                 content=content,
-                category=InsightCategory(category),
-                importance=Importance(importance),
+                category=insight_category,
+                importance=insight_importance,
                 source=source_metadata,
             )
 
@@ -1337,6 +1345,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                     )
                 ],
             )
+            remember_insight(brain_id, content, insight_id, content_vector)
 
             output = {
                 "status": "created",
@@ -1514,15 +1523,14 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
         Returns:
             Result with brain_id, status, and message
         """
-        from .models import generate_brain_id
+        from .models import DEFAULT_TIER_THRESHOLDS, generate_brain_id
 
         start = time.perf_counter()
         params = {"vertical": vertical, "name": name}
 
         try:
             # Validate vertical format
-            import re
-            if not re.match(r"^[a-z][a-z0-9_-]*$", vertical):
+            if not _VERTICAL_PATTERN.match(vertical):
                 raise ToolError(
                     f"Invalid vertical format: {vertical}. "
                     "Must be lowercase, start with letter, alphanumeric with hyphens/underscores."
@@ -1542,7 +1550,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
 
             # Default config
             default_config = {
-                "default_tier_thresholds": {"tier1": 90, "tier2": 70, "tier3": 50},
+                "default_tier_thresholds": DEFAULT_TIER_THRESHOLDS.copy(),
                 "auto_response_enabled": False,
                 "learning_enabled": True,
                 "quality_gate_threshold": 0.7,
@@ -1640,13 +1648,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 key_field="name",
             )
 
-            output = {
-                "brain_id": result.brain_id,
-                "collection": result.collection,
-                "seeded_count": result.seeded_count,
-                "errors": [e.model_dump() for e in result.errors],
-                "message": result.message,
-            }
+            output = result.model_dump()
 
             log_tool_result("seed_icp_rules", params, output, start)
             return output
@@ -1690,13 +1692,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 key_field="name",
             )
 
-            output = {
-                "brain_id": result.brain_id,
-                "collection": result.collection,
-                "seeded_count": result.seeded_count,
-                "errors": [e.model_dump() for e in result.errors],
-                "message": result.message,
-            }
+            output = result.model_dump()
 
             log_tool_result("seed_templates", params, output, start)
             return output
@@ -1741,13 +1737,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 key_field="objection_text",
             )
 
-            output = {
-                "brain_id": result.brain_id,
-                "collection": result.collection,
-                "seeded_count": result.seeded_count,
-                "errors": [e.model_dump() for e in result.errors],
-                "message": result.message,
-            }
+            output = result.model_dump()
 
             log_tool_result("seed_handlers", params, output, start)
             return output
@@ -1792,13 +1782,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 key_field="topic",
             )
 
-            output = {
-                "brain_id": result.brain_id,
-                "collection": result.collection,
-                "seeded_count": result.seeded_count,
-                "errors": [e.model_dump() for e in result.errors],
-                "message": result.message,
-            }
+            output = result.model_dump()
 
             log_tool_result("seed_research", params, output, start)
             return output
@@ -1846,10 +1830,9 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 raise ToolError(f"Invalid brain_id format: {brain_id}")
 
             # Validate status value
-            try:
-                new_status = BrainStatus(status)
-            except ValueError:
-                valid_statuses = [s.value for s in BrainStatus]
+            new_status = BRAIN_STATUS_BY_VALUE.get(status)
+            if new_status is None:
+                valid_statuses = list(BRAIN_STATUS_BY_VALUE)
                 raise ToolError(
                     f"Invalid status '{status}'. Must be one of: {valid_statuses}"
                 )
@@ -1861,7 +1844,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
 
             # Validate transition
             if not validate_status_transition(current_status, new_status):
-                valid_targets = [s.value for s in VALID_TRANSITIONS.get(current_status, [])]
+                valid_targets = sorted(s.value for s in VALID_TRANSITIONS.get(current_status, ()))
                 raise ToolError(
                     f"Invalid transition from '{current_status.value}' to '{new_status.value}'. "
                     f"Valid transitions from '{current_status.value}': {valid_targets}"
@@ -2041,7 +2024,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
             content_details (per-collection stats with last_updated),
             created_at, updated_at, message
         """
-        from .models import BrainStatsResult, calculate_completeness
+        from .models import calculate_completeness_from_counts
 
         start = time.perf_counter()
         params = {"brain_id": brain_id}
@@ -2066,7 +2049,6 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                 "templates_count": 0,
                 "handlers_count": 0,
                 "research_docs_count": 0,
-                "insights_count": 0,
             }
 
             stats_key_map = {
@@ -2119,11 +2101,7 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                     })
 
             # Calculate completeness
-            stats_result = BrainStatsResult(
-                brain_id=brain_id,
-                **stats_for_completeness,
-            )
-            completeness = calculate_completeness(stats_result)
+            completeness = calculate_completeness_from_counts(**stats_for_completeness)
 
             output = {
                 "brain_id": brain_id,
@@ -2236,6 +2214,8 @@ def register_qdrant_tools(mcp: FastMCP) -> None:
                     # Collection may not exist, default to 0
                     deleted_counts[display_name] = 0
 
+            forget_brain(brain_id)
+
             # Delete the brain itself by querying for actual point ID
             try:
                 brain_results, _ = qdrant.scroll(
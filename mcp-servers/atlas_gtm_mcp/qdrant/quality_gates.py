@@ -8,14 +8,37 @@ Implements quality control checks per the add_insight contract:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
 import os
-from typing import TYPE_CHECKING
-
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
 import structlog
-from qdrant_client import QdrantClient
-from qdrant_client.models import FieldCondition, Filter, MatchValue
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    MatchValue,
+    QuantizationSearchParams,
+    QueryRequest,
+    SearchParams,
+)
+
+try:
+    from numba import njit
 
-from .embeddings import embed_query
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from .embeddings import embed_batch, embed_query
 from .models import (
     Importance,
     InsightCategory,
@@ -32,24 +55,418 @@ log = structlog.get_logger()
 DUPLICATE_SIMILARITY_THRESHOLD = 0.85  # FR-011
 MIN_CONFIDENCE_THRESHOLD = 0.70  # Contract requirement
 
-# Qdrant client - initialized lazily
-_qdrant_client: QdrantClient | None = None
+# Duplicate searches ask for a single hit, so a small HNSW beam is enough.
+# The insights collection keeps int8-quantized vectors in RAM; oversample the
+# quantized candidates and rescore them on the original vectors so the 0.85
+# threshold is applied to exact similarities. Ignored on unquantized collections.
+DUPLICATE_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=int(os.getenv("QDRANT_EF_DUPLICATE", "64")),
+    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0),
+)
 
+# Semantic cache for duplicate decisions. A new query whose embedding is this
+# close to a recently confirmed duplicate query is checked against that query's
+# matched insight instead of searching Qdrant.
+SEMANTIC_CACHE_THRESHOLD = 0.87
+SEMANTIC_CACHE_MAXSIZE = 4096
+SEMANTIC_CACHE_TTL_SECONDS = 300.0
+
+EXACT_MATCH_CACHE_MAXSIZE = 16384
+# Insights deleted outside delete_brain are not seen here; the TTL bounds how
+# long a deleted ID can still be reported as an exact duplicate.
+EXACT_MATCH_CACHE_TTL_SECONDS = SEMANTIC_CACHE_TTL_SECONDS
+EMBEDDING_CACHE_MAXSIZE = 8192
+RECENT_INSIGHTS_PER_BRAIN = 512
+
+# Voyage accepts at most 100 texts per embed call
+EMBED_BATCH_SIZE = 100
+
+# Qdrant client - initialized lazily and shared across calls on the same event
+# loop. Duplicate checks ship a full embedding per request, so gRPC (protobuf
+# over HTTP/2) is used unless QDRANT_FORCE_HTTP=1.
+_qdrant_client: AsyncQdrantClient | None = None
+_qdrant_client_loop: asyncio.AbstractEventLoop | None = None
+_qdrant_client_lock = threading.Lock()
+# Close tasks for clients replaced on a loop change; held so they are not GC'd
+_closing_clients: set[asyncio.Future] = set()
+
+
+def _get_qdrant_client() -> AsyncQdrantClient:
+    """Get or create the async Qdrant client for the running event loop.
+
+    A client created on a previous loop is replaced and closed.
+    """
+    global _qdrant_client, _qdrant_client_loop
+    loop = asyncio.get_running_loop()
+    if _qdrant_client is None or _qdrant_client_loop is not loop:
+        stale = None
+        with _qdrant_client_lock:
+            if _qdrant_client is None or _qdrant_client_loop is not loop:
+                stale, stale_loop = _qdrant_client, _qdrant_client_loop
+                _qdrant_client = _create_qdrant_client()
+                _qdrant_client_loop = loop
+        if stale is not None:
+            _close_stale_client(stale, stale_loop)
+    return _qdrant_client
 
-def _get_qdrant_client() -> QdrantClient:
-    """Get or create the Qdrant client."""
-    global _qdrant_client
-    if _qdrant_client is None:
-        host = os.getenv("QDRANT_HOST", "localhost")
-        port = os.getenv("QDRANT_PORT", "6333")
-        api_key = os.getenv("QDRANT_API_KEY")
 
+def _close_stale_client(client: AsyncQdrantClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Close a client replaced by _get_qdrant_client without blocking the caller.
+
+    The close runs on the client's own loop if that loop is still running in
+    another thread, otherwise on the current loop.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        future = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.close(), loop))
+    else:
+        future = asyncio.ensure_future(client.close())
+    _closing_clients.add(future)
+    future.add_done_callback(_on_stale_client_closed)
+
+
+def _on_stale_client_closed(future: asyncio.Future) -> None:
+    """Release a finished close task and log a failed close."""
+    _closing_clients.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        log.warning("qdrant_client_close_failed", error=str(future.exception()))
+
+
+def _create_qdrant_client() -> AsyncQdrantClient:
+    """Create a gRPC Qdrant client, or an HTTP one when QDRANT_FORCE_HTTP=1."""
+    host = os.getenv("QDRANT_HOST", "localhost")
+    port = os.getenv("QDRANT_PORT", "6333")
+    api_key = os.getenv("QDRANT_API_KEY")
+
+    if os.getenv("QDRANT_FORCE_HTTP") == "1":
         # Use url parameter to explicitly specify HTTP (not HTTPS)
-        _qdrant_client = QdrantClient(
+        return AsyncQdrantClient(
             url=f"http://{host}:{port}",
             api_key=api_key,
         )
-    return _qdrant_client
+
+    return AsyncQdrantClient(
+        host=host,
+        port=int(port),
+        grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+        prefer_grpc=True,
+        https=False,
+        api_key=api_key,
+    )
+
+
+class QualityGateItem(NamedTuple):
+    """One insight submitted to run_quality_gate_batch."""
+
+    content: str
+    category: InsightCategory | str
+    importance: Importance | str
+    source: SourceMetadata
+
+
+class _CachedDuplicate(NamedTuple):
+    """A confirmed duplicate decision remembered by the semantic cache."""
+
+    brain_id: str
+    vector: np.ndarray
+    existing_id: str
+    existing_vector: np.ndarray
+    expires_at: float
+
+
+class _SemanticCache:
+    """In-process LRU cache of duplicate decisions keyed by query embedding.
+
+    Only positive (duplicate) decisions are cached: a "not a duplicate" answer
+    goes stale as soon as the insight is stored, a duplicate one does not
+    (until the existing insight is deleted, which the TTL bounds).
+
+    Each entry keeps the matched insight's vector as well as the query's. A
+    near query is only a hint: the reported similarity is recomputed against
+    the insight and must still clear DUPLICATE_SIMILARITY_THRESHOLD, since two
+    queries within the cache threshold can sit on opposite sides of it.
+
+    Vectors are L2-normalized on insertion so a dot product is the cosine
+    similarity. Lookups scan only the entries for the requested brain.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = SEMANTIC_CACHE_MAXSIZE,
+        ttl: float = SEMANTIC_CACHE_TTL_SECONDS,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        duplicate_threshold: float = DUPLICATE_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.duplicate_threshold = duplicate_threshold
+        self._entries: OrderedDict[int, _CachedDuplicate] = OrderedDict()
+        self._by_brain: dict[str, set[int]] = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, brain_id: str, vector: np.ndarray) -> tuple[str, float] | None:
+        """Return (existing_id, similarity) for a cached match, or None.
+
+        The similarity is the query's own score against the existing insight.
+
+        Args:
+            brain_id: Brain ID the query is scoped to.
+            vector: L2-normalized query embedding.
+        """
+        with self._lock:
+            keys = self._by_brain.get(brain_id)
+            if not keys:
+                return None
+
+            now = time.monotonic()
+            for key in [k for k in keys if self._entries[k].expires_at <= now]:
+                self._evict(key)
+            if not keys:
+                return None
+
+            candidates = list(keys)
+            matrix = np.stack([self._entries[k].vector for k in candidates])
+            scores = matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            key = candidates[best]
+            entry = self._entries[key]
+            similarity = float(entry.existing_vector @ vector)
+            if similarity < self.duplicate_threshold:
+                return None
+
+            self._entries.move_to_end(key)
+            return (entry.existing_id, similarity)
+
+    def put(
+        self,
+        brain_id: str,
+        vector: np.ndarray,
+        existing_id: str,
+        existing_vector: np.ndarray,
+    ) -> None:
+        """Remember that a query embedding matched an existing insight.
+
+        Both vectors must be L2-normalized.
+        """
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+            self._entries[key] = _CachedDuplicate(
+                brain_id=brain_id,
+                vector=vector,
+                existing_id=existing_id,
+                existing_vector=existing_vector,
+                expires_at=time.monotonic() + self.ttl,
+            )
+            self._by_brain.setdefault(brain_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._evict(next(iter(self._entries)))
+
+    def forget(self, brain_id: str) -> None:
+        """Drop all cached decisions for a brain."""
+        with self._lock:
+            for key in list(self._by_brain.get(brain_id, ())):
+                self._evict(key)
+
+    def clear(self) -> None:
+        """Drop all cached decisions."""
+        with self._lock:
+            self._entries.clear()
+            self._by_brain.clear()
+
+    def _evict(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        keys = self._by_brain[entry.brain_id]
+        keys.discard(key)
+        if not keys:
+            del self._by_brain[entry.brain_id]
+
+
+def _max_dot_numpy(vectors: np.ndarray, query: np.ndarray) -> tuple[int, float]:
+    """Return (row, score) of the row of vectors with the largest dot product."""
+    scores = vectors @ query
+    best_row = int(scores.argmax())
+    return best_row, float(scores[best_row])
+
+
+if NUMBA_AVAILABLE:
+
+    # Only the reassociation/contraction flags: fastmath=True would also assume
+    # no infs/NaNs, letting LLVM fold the max comparison away. Compiled on first
+    # call (or loaded from the on-disk cache) rather than at import.
+    @njit(fastmath={"contract", "reassoc", "arcp"}, cache=True)
+    def _max_dot_numba(vectors: np.ndarray, query: np.ndarray) -> tuple[int, float]:
+        """Return (row, score) of the row of vectors with the largest dot product."""
+        best_row = 0
+        best_score = 0.0
+        for col in range(vectors.shape[1]):
+            best_score += vectors[0, col] * query[col]
+        for row in range(1, vectors.shape[0]):
+            score = 0.0
+            for col in range(vectors.shape[1]):
+                score += vectors[row, col] * query[col]
+            if score > best_score:
+                best_row = row
+                best_score = score
+        return best_row, best_score
+
+    _max_dot = _max_dot_numba
+else:
+    _max_dot = _max_dot_numpy
+
+
+class _RecentInsights:
+    """Per-brain ring buffer of the most recently stored insight vectors.
+
+    Freshly stored insights are the likeliest duplicates during streaming
+    ingest, so each query is matched against them with one matrix product
+    before falling back to Qdrant. Vectors are L2-normalized float32 rows.
+    """
+
+    def __init__(self, capacity: int = RECENT_INSIGHTS_PER_BRAIN) -> None:
+        self.capacity = capacity
+        # brain_id -> (vectors of shape (capacity, dim), insight IDs, total added)
+        self._rings: dict[str, tuple[np.ndarray, list[str], int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, brain_id: str, vector: np.ndarray, insight_id: str) -> None:
+        """Store a newly created insight's vector, overwriting the oldest."""
+        with self._lock:
+            ring = self._rings.get(brain_id)
+            if ring is None or ring[0].shape[1] != vector.shape[0]:
+                ring = (
+                    np.zeros((self.capacity, vector.shape[0]), dtype=np.float32),
+                    [""] * self.capacity,
+                    0,
+                )
+            vectors, ids, added = ring
+            slot = added % self.capacity
+            vectors[slot] = vector
+            ids[slot] = insight_id
+            self._rings[brain_id] = (vectors, ids, added + 1)
+
+    def match(
+        self, brain_id: str, queries: np.ndarray, threshold: float
+    ) -> list[tuple[str, float] | None]:
+        """Match normalized query rows against the brain's recent insights.
+
+        Returns:
+            Per query, (insight_id, similarity) of the best match at or above
+            the threshold, or None.
+        """
+        with self._lock:
+            ring = self._rings.get(brain_id)
+            if ring is None or ring[0].shape[1] != queries.shape[1]:
+                return [None] * len(queries)
+            vectors, ids, added = ring
+            candidates = vectors[: min(added, self.capacity)]
+            matches: list[tuple[str, float] | None] = []
+            for query in queries:
+                row, score = _max_dot(candidates, query)
+                matches.append((ids[row], score) if score >= threshold else None)
+            return matches
+
+    def forget(self, brain_id: str) -> None:
+        """Drop the ring for a brain."""
+        with self._lock:
+            self._rings.pop(brain_id, None)
+
+    def clear(self) -> None:
+        """Drop all rings."""
+        with self._lock:
+            self._rings.clear()
+
+
+def _normalize(vector: list[float] | np.ndarray) -> np.ndarray:
+    """Return the embedding as a new unit-length float32 array."""
+    array = np.array(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if norm:
+        array /= norm
+    return array
+
+
+_semantic_cache = _SemanticCache()
+_recent_insights = _RecentInsights()
+
+# Query embedding cache: SHA-256 of content -> float32 vector
+_embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+# Exact-match cache: (brain_id, digest of normalized content) -> (insight ID, expiry)
+_exact_matches: OrderedDict[tuple[str, bytes], tuple[str, float]] = OrderedDict()
+_exact_matches_lock = threading.Lock()
+
+
+def _content_key(brain_id: str, content: str) -> tuple[str, bytes]:
+    """Build the exact-match key, ignoring case and surrounding whitespace."""
+    return (brain_id, hashlib.sha256(content.strip().lower().encode()).digest())
+
+
+def _exact_match_get(brain_id: str, content: str) -> str | None:
+    """Return the ID of a stored insight with the same content, if known."""
+    key = _content_key(brain_id, content)
+    with _exact_matches_lock:
+        entry = _exact_matches.get(key)
+        if entry is None:
+            return None
+        existing_id, expires_at = entry
+        if expires_at <= time.monotonic():
+            del _exact_matches[key]
+            return None
+        _exact_matches.move_to_end(key)
+        return existing_id
+
+
+def remember_insight(
+    brain_id: str, content: str, insight_id: str, vector: list[float] | np.ndarray
+) -> None:
+    """Record a newly stored insight so resubmissions are caught early.
+
+    Exact resubmissions are matched by content hash. Near-duplicates are
+    matched against the brain's recent insights by the document embedding
+    stored in Qdrant, so they score exactly as the Qdrant search would.
+
+    Args:
+        brain_id: Brain the insight belongs to.
+        content: The stored insight content.
+        insight_id: ID of the stored insight.
+        vector: Document embedding the insight was stored with.
+    """
+    key = _content_key(brain_id, content)
+    with _exact_matches_lock:
+        _exact_matches[key] = (insight_id, time.monotonic() + EXACT_MATCH_CACHE_TTL_SECONDS)
+        _exact_matches.move_to_end(key)
+        if len(_exact_matches) > EXACT_MATCH_CACHE_MAXSIZE:
+            _exact_matches.popitem(last=False)
+
+    _recent_insights.add(brain_id, _normalize(vector), insight_id)
+
+
+def forget_brain(brain_id: str) -> None:
+    """Drop cached duplicate decisions for a brain whose insights were deleted."""
+    _semantic_cache.forget(brain_id)
+    _recent_insights.forget(brain_id)
+    with _exact_matches_lock:
+        for key in [key for key in _exact_matches if key[0] == brain_id]:
+            del _exact_matches[key]
+
+
+def clear_caches() -> None:
+    """Drop all in-process duplicate-check caches."""
+    _semantic_cache.clear()
+    _recent_insights.clear()
+    with _exact_matches_lock:
+        _exact_matches.clear()
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
 
 
 # Confidence scoring weights per contract
@@ -68,6 +485,25 @@ VALIDATION_REQUIRED_CATEGORIES = frozenset(
     }
 )
 
+# Precomputed should_require_validation decisions, keyed by
+# (importance, category, confidence below 0.80)
+_VALIDATION_TABLE: dict[tuple[Importance, InsightCategory, bool], bool] = {
+    (importance, category, low_confidence): (
+        importance == Importance.HIGH
+        or category in VALIDATION_REQUIRED_CATEGORIES
+        or low_confidence
+    )
+    for importance in Importance
+    for category in InsightCategory
+    for low_confidence in (False, True)
+}
+
+_IMPORTANCE_VALUES = frozenset(importance.value for importance in Importance)
+_CATEGORY_VALUES = frozenset(category.value for category in InsightCategory)
+_REQUIRED_CATEGORY_VALUES = np.array(
+    sorted(category.value for category in VALIDATION_REQUIRED_CATEGORIES)
+)
+
 
 def calculate_confidence(content: str, source: SourceMetadata) -> float:
     """Calculate confidence score for an insight.
@@ -85,42 +521,129 @@ def calculate_confidence(content: str, source: SourceMetadata) -> float:
     Returns:
         Confidence score between 0.0 and 1.0.
     """
-    # Base score
-    confidence = 0.5
-
-    # Source type bonus
-    source_bonus = SOURCE_TYPE_SCORES.get(source.type, 0.0)
-    confidence += source_bonus
-
-    # Extracted quote bonus
-    if source.extracted_quote:
-        confidence += 0.10
-
-    # Company name bonus
-    if source.company_name:
-        confidence += 0.10
-
-    # Cap at 1.0
-    confidence = min(confidence, 1.0)
-
-    log.debug(
-        "confidence_calculation",
-        source_type=source.type,
-        has_quote=bool(source.extracted_quote),
-        has_company=bool(source.company_name),
-        final_score=round(confidence, 2),
+    has_quote = bool(source.extracted_quote)
+    has_company = bool(source.company_name)
+
+    # Base score + source type bonus + quote and company bonuses, capped at 1.0
+    confidence = (
+        0.5 + SOURCE_TYPE_SCORES.get(source.type, 0.0) + 0.10 * has_quote + 0.10 * has_company
     )
+    if confidence > 1.0:
+        confidence = 1.0
+    confidence = int(confidence * 100 + 0.5) / 100
+
+    if log.is_enabled_for(logging.DEBUG):
+        log.debug(
+            "confidence_calculation",
+            source_type=source.type,
+            has_quote=has_quote,
+            has_company=has_company,
+            final_score=confidence,
+        )
+
+    return confidence
+
+
+def calculate_confidence_batch(
+    contents: Sequence[str],
+    sources: Sequence[SourceMetadata],
+) -> list[float]:
+    """Calculate confidence scores for several insights.
+
+    Same formula as calculate_confidence, without per-item debug logging.
 
-    return round(confidence, 2)
+    Args:
+        contents: The insight contents.
+        sources: Source metadata, one per content.
+
+    Returns:
+        Confidence scores in input order.
+    """
+    if len(contents) != len(sources):
+        raise ValueError("contents and sources must have the same length")
+
+    source_scores = SOURCE_TYPE_SCORES.get
+    confidences = []
+    for source in sources:
+        confidence = (
+            0.5
+            + source_scores(source.type, 0.0)
+            + 0.10 * bool(source.extracted_quote)
+            + 0.10 * bool(source.company_name)
+        )
+        if confidence > 1.0:
+            confidence = 1.0
+        confidences.append(int(confidence * 100 + 0.5) / 100)
+    return confidences
+
+
+@lru_cache(maxsize=256)
+def _brain_filter(brain_id: str) -> Filter:
+    """Build the brain_id filter once per brain; qdrant-client only reads it."""
+    return Filter(must=[FieldCondition(key="brain_id", match=MatchValue(value=brain_id))])
+
+
+def _embed_queries(contents: Sequence[str]) -> list[np.ndarray]:
+    """Embed query texts, reusing cached vectors for content seen before.
+
+    Uncached contents are embedded with one Voyage call per EMBED_BATCH_SIZE
+    contents. Vectors are kept as float32 arrays.
+    """
+    keys = [hashlib.sha256(content.encode()).digest() for content in contents]
+    vectors: list[np.ndarray | None] = []
+    with _embedding_cache_lock:
+        for key in keys:
+            vector = _embedding_cache.get(key)
+            if vector is not None:
+                _embedding_cache.move_to_end(key)
+            vectors.append(vector)
+
+    missing = [index for index, vector in enumerate(vectors) if vector is None]
+    if not missing:
+        return vectors
+
+    if len(missing) == 1:
+        embedded = [embed_query(contents[missing[0]])]
+    else:
+        embedded = []
+        for offset in range(0, len(missing), EMBED_BATCH_SIZE):
+            chunk = [contents[index] for index in missing[offset : offset + EMBED_BATCH_SIZE]]
+            embedded.extend(embed_batch(chunk, input_type="query"))
+
+    with _embedding_cache_lock:
+        for index, raw in zip(missing, embedded, strict=True):
+            vector = np.asarray(raw, dtype=np.float32)
+            vectors[index] = vector
+            _embedding_cache[keys[index]] = vector
+            _embedding_cache.move_to_end(keys[index])
+        while len(_embedding_cache) > EMBEDDING_CACHE_MAXSIZE:
+            _embedding_cache.popitem(last=False)
+
+    return vectors
+
+
+def _log_duplicate(brain_id: str, existing_id: str, similarity: float, matched_by: str) -> None:
+    """Log a duplicate decision; arguments are only built when INFO is enabled."""
+    if log.is_enabled_for(logging.INFO):
+        log.info(
+            "duplicate_detected",
+            brain_id=brain_id,
+            existing_id=existing_id,
+            similarity=similarity,
+            matched_by=matched_by,
+        )
 
 
-def check_duplicate(
+async def check_duplicate(
     brain_id: str,
     content: str,
 ) -> tuple[bool, str | None, float | None]:
     """Check if content is a duplicate of an existing insight.
 
-    Uses semantic similarity with 0.85 threshold per FR-011.
+    Uses semantic similarity with 0.85 threshold per FR-011. Content that
+    was already stored by this process, or that closely matches a recently
+    confirmed duplicate, is answered from in-process caches without a
+    Qdrant round-trip.
 
     Args:
         brain_id: Brain ID to scope the search.
@@ -130,35 +653,131 @@ def check_duplicate(
         Tuple of (is_duplicate, existing_id, similarity_score).
         If not a duplicate, returns (False, None, None).
     """
-    client = _get_qdrant_client()
+    return (await check_duplicate_batch(brain_id, [content]))[0]
+
 
-    # Generate embedding for the content
-    content_vector = embed_query(content)
+async def check_duplicate_batch(
+    brain_id: str,
+    contents: Sequence[str],
+) -> list[tuple[bool, str | None, float | None]]:
+    """Check several contents for duplicates with one embedding and search pass.
+
+    Contents are embedded in batches and every cache miss is searched in a
+    single Qdrant query_batch_points request.
+
+    Args:
+        brain_id: Brain ID to scope the search.
+        contents: The insight contents to check.
+
+    Returns:
+        One (is_duplicate, existing_id, similarity_score) tuple per content,
+        in input order.
+    """
+    if not contents:
+        return []
+
+    results: list[tuple[bool, str | None, float | None]] = [(False, None, None)] * len(
+        contents
+    )
+
+    # Byte-identical resubmissions skip embedding and search entirely
+    pending: list[int] = []
+    for index, content in enumerate(contents):
+        existing_id = _exact_match_get(brain_id, content)
+        if existing_id is None:
+            pending.append(index)
+            continue
+        _log_duplicate(brain_id, existing_id, 1.0, "exact")
+        results[index] = (True, existing_id, 1.0)
+
+    if not pending:
+        return results
+
+    # Generate embeddings for the remaining contents (Voyage client is blocking)
+    content_vectors = await asyncio.to_thread(
+        _embed_queries, [contents[index] for index in pending]
+    )
+
+    misses: list[tuple[int, list[float], np.ndarray]] = []
+    for index, content_vector in zip(pending, content_vectors, strict=True):
+        normalized = _normalize(content_vector)
+        cached = _semantic_cache.get(brain_id, normalized)
+        if cached is None:
+            misses.append((index, content_vector.tolist(), normalized))
+            continue
+        existing_id, similarity_score = cached
+        _log_duplicate(brain_id, existing_id, similarity_score, "cache")
+        results[index] = (True, existing_id, similarity_score)
+
+    if not misses:
+        return results
+
+    # Compare against the brain's recently stored insights in one product
+    recent = _recent_insights.match(
+        brain_id,
+        np.stack([normalized for _, _, normalized in misses]),
+        DUPLICATE_SIMILARITY_THRESHOLD,
+    )
+    remaining = []
+    for miss, match in zip(misses, recent, strict=True):
+        if match is None:
+            remaining.append(miss)
+            continue
+        existing_id, similarity_score = match
+        _log_duplicate(brain_id, existing_id, similarity_score, "recent")
+        results[miss[0]] = (True, existing_id, similarity_score)
+    misses = remaining
+
+    if not misses:
+        return results
+
+    client = _get_qdrant_client()
+    brain_filter = _brain_filter(brain_id)
 
     # Search for similar insights
-    results = client.query_points(
-        collection_name="insights",
-        query=content_vector,
-        query_filter=Filter(
-            must=[FieldCondition(key="brain_id", match=MatchValue(value=brain_id))]
-        ),
-        limit=1,
-        score_threshold=DUPLICATE_SIMILARITY_THRESHOLD,
-    ).points
-
-    if results:
-        # Found a similar insight
-        existing_id = str(results[0].id)
-        similarity_score = results[0].score
-        log.info(
-            "duplicate_detected",
-            brain_id=brain_id,
-            existing_id=existing_id,
-            similarity=round(similarity_score, 3),
+    if len(misses) == 1:
+        hits = [
+            (
+                await client.query_points(
+                    collection_name="insights",
+                    query=misses[0][1],
+                    query_filter=brain_filter,
+                    search_params=DUPLICATE_SEARCH_PARAMS,
+                    limit=1,
+                    score_threshold=DUPLICATE_SIMILARITY_THRESHOLD,
+                    with_vectors=True,
+                )
+            ).points
+        ]
+    else:
+        responses = await client.query_batch_points(
+            collection_name="insights",
+            requests=[
+                QueryRequest(
+                    query=content_vector,
+                    filter=brain_filter,
+                    params=DUPLICATE_SEARCH_PARAMS,
+                    limit=1,
+                    score_threshold=DUPLICATE_SIMILARITY_THRESHOLD,
+                    with_vector=True,
+                )
+                for _, content_vector, _ in misses
+            ],
         )
-        return (True, existing_id, similarity_score)
+        hits = [response.points for response in responses]
+
+    for (index, _, normalized), points in zip(misses, hits, strict=True):
+        if not points:
+            continue
+        # Found a similar insight
+        existing_id = str(points[0].id)
+        similarity_score = points[0].score
+        if points[0].vector is not None:
+            _semantic_cache.put(brain_id, normalized, existing_id, _normalize(points[0].vector))
+        _log_duplicate(brain_id, existing_id, similarity_score, "qdrant")
+        results[index] = (True, existing_id, similarity_score)
 
-    return (False, None, None)
+    return results
 
 
 def should_require_validation(
@@ -182,27 +801,47 @@ def should_require_validation(
         True if validation is required.
     """
     # Normalize to enum values if strings
-    if isinstance(importance, str):
+    if importance.__class__ is str:
         importance = Importance(importance)
-    if isinstance(category, str):
+    if category.__class__ is str:
         category = InsightCategory(category)
 
-    # High importance always requires validation
-    if importance == Importance.HIGH:
-        return True
+    return _VALIDATION_TABLE[(importance, category, confidence < 0.80)]
 
-    # Specific categories require validation
-    if category in VALIDATION_REQUIRED_CATEGORIES:
-        return True
 
-    # Low confidence requires validation
-    if confidence < 0.80:
-        return True
+def should_require_validation_batch(
+    importances: Sequence[Importance | str],
+    categories: Sequence[InsightCategory | str],
+    confidences: Sequence[float],
+) -> np.ndarray:
+    """Vectorized should_require_validation over parallel sequences.
 
-    return False
+    Args:
+        importances: Importance level per insight.
+        categories: Insight category per insight.
+        confidences: Calculated confidence score per insight.
+
+    Returns:
+        Boolean array, True where validation is required.
+
+    Raises:
+        ValueError: If the sequences differ in length or hold unknown values.
+    """
+    if not len(importances) == len(categories) == len(confidences):
+        raise ValueError("importances, categories and confidences must have the same length")
+    if not _IMPORTANCE_VALUES.issuperset(importances):
+        raise ValueError(f"Unknown importance in {list(importances)}")
+    if not _CATEGORY_VALUES.issuperset(categories):
+        raise ValueError(f"Unknown category in {list(categories)}")
+
+    # StrEnum members compare equal to their values, so enums and strings mix freely
+    high = np.array(importances, dtype=str) == Importance.HIGH.value
+    required_category = np.isin(np.array(categories, dtype=str), _REQUIRED_CATEGORY_VALUES)
+    low_confidence = np.asarray(confidences, dtype=np.float64) < 0.80
+    return high | required_category | low_confidence
 
 
-def run_quality_gate(
+async def run_quality_gate(
     brain_id: str,
     content: str,
     category: InsightCategory | str,
@@ -227,51 +866,111 @@ def run_quality_gate(
     Returns:
         QualityGateResult with all check results.
     """
+    results = await run_quality_gate_batch(
+        brain_id, [QualityGateItem(content, category, importance, source)]
+    )
+    return results[0]
+
+
+def run_quality_gate_sync(
+    brain_id: str,
+    content: str,
+    category: InsightCategory | str,
+    importance: Importance | str,
+    source: SourceMetadata,
+) -> QualityGateResult:
+    """Run run_quality_gate from synchronous code.
+
+    Must not be called from inside a running event loop.
+    """
+    return asyncio.run(run_quality_gate(brain_id, content, category, importance, source))
+
+
+async def run_quality_gate_batch(
+    brain_id: str,
+    items: Sequence[QualityGateItem],
+) -> list[QualityGateResult]:
+    """Run all quality gate checks for several insights of one brain.
+
+    Same checks as run_quality_gate, but the duplicate check for every item
+    that clears the confidence threshold is done in one batched pass.
+
+    Args:
+        brain_id: Brain ID for duplicate checking.
+        items: Insights to check.
+
+    Returns:
+        One QualityGateResult per item, in input order.
+    """
     # Calculate confidence
-    confidence = calculate_confidence(content, source)
+    confidences = calculate_confidence_batch(
+        [item.content for item in items], [item.source for item in items]
+    )
+
+    results: list[QualityGateResult | None] = [None] * len(items)
+    candidates: list[int] = []
+    for index, confidence in enumerate(confidences):
+        # Check minimum confidence threshold
+        if confidence < MIN_CONFIDENCE_THRESHOLD:
+            log.info(
+                "quality_gate_rejected",
+                reason="confidence_below_threshold",
+                confidence=confidence,
+                threshold=MIN_CONFIDENCE_THRESHOLD,
+            )
+            results[index] = QualityGateResult(
+                passed=False,
+                confidence_score=confidence,
+                is_duplicate=False,
+                requires_validation=False,
+                rejection_reason=(
+                    f"Confidence {confidence} below threshold {MIN_CONFIDENCE_THRESHOLD}"
+                ),
+            )
+        else:
+            candidates.append(index)
+
+    # Check for duplicates
+    duplicates = await check_duplicate_batch(brain_id, [items[i].content for i in candidates])
+
+    # Determine validation requirements for every candidate in one pass
+    validation = should_require_validation_batch(
+        [items[i].importance for i in candidates],
+        [items[i].category for i in candidates],
+        [confidences[i] for i in candidates],
+    ).tolist()
+
+    for index, (is_duplicate, duplicate_id, similarity_score), requires_validation in zip(
+        candidates, duplicates, validation, strict=True
+    ):
+        confidence = confidences[index]
+
+        if is_duplicate:
+            results[index] = QualityGateResult(
+                passed=False,
+                confidence_score=confidence,
+                is_duplicate=True,
+                duplicate_id=duplicate_id,
+                similarity_score=similarity_score,
+                requires_validation=False,
+                rejection_reason=(
+                    f"Similar insight exists (ID: {duplicate_id}, "
+                    f"similarity: {similarity_score})"
+                ),
+            )
+            continue
 
-    # Check minimum confidence threshold
-    if confidence < MIN_CONFIDENCE_THRESHOLD:
         log.info(
-            "quality_gate_rejected",
-            reason="confidence_below_threshold",
+            "quality_gate_passed",
             confidence=confidence,
-            threshold=MIN_CONFIDENCE_THRESHOLD,
-        )
-        return QualityGateResult(
-            passed=False,
-            confidence_score=confidence,
-            is_duplicate=False,
-            requires_validation=False,
-            rejection_reason=f"Confidence {confidence} below threshold {MIN_CONFIDENCE_THRESHOLD}",
+            requires_validation=requires_validation,
         )
 
-    # Check for duplicates
-    is_duplicate, duplicate_id, similarity_score = check_duplicate(brain_id, content)
-
-    if is_duplicate:
-        return QualityGateResult(
-            passed=False,
+        results[index] = QualityGateResult(
+            passed=True,
             confidence_score=confidence,
-            is_duplicate=True,
-            duplicate_id=duplicate_id,
-            similarity_score=similarity_score,
-            requires_validation=False,
-            rejection_reason=f"Similar insight exists (ID: {duplicate_id}, similarity: {similarity_score})",
+            is_duplicate=False,
+            requires_validation=requires_validation,
         )
 
-    # Determine validation requirement
-    requires_validation = should_require_validation(importance, category, confidence)
-
-    log.info(
-        "quality_gate_passed",
-        confidence=confidence,
-        requires_validation=requires_validation,
-    )
-
-    return QualityGateResult(
-        passed=True,
-        confidence_score=confidence,
-        is_duplicate=False,
-        requires_validation=requires_validation,
-    )
+    return results
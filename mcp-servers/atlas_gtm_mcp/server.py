@@ -1,6 +1,8 @@
 """Main MCP server combining all Atlas GTM tools."""
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
@@ -8,17 +10,27 @@ from fastmcp import FastMCP
 from .qdrant import register_qdrant_tools
 from .attio import register_attio_tools
 from .instantly import register_instantly_tools
-from .slack import register_slack_tools
+from .slack import register_slack_tools, slack
 from .verticals import register_vertical_tools
 
 load_dotenv()
 
 
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release shared HTTP connections when the server shuts down."""
+    try:
+        yield
+    finally:
+        await slack.close()
+
+
 def create_server() -> FastMCP:
     """Create and configure the Atlas GTM MCP server."""
     mcp = FastMCP(
         name="atlas-gtm-mcp",
         instructions="MCP server for Atlas GTM - Knowledge Base, CRM, and Email tools",
+        lifespan=_lifespan,
     )
 
     # Register all tool groups
@@ -8,11 +8,17 @@ due to trigger_id's 3-second expiration - that requires direct @slack/web-api.
 @module slack
 """
 
+import asyncio
+import inspect
 import os
-from datetime import datetime
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Any
 
 import httpx
+import orjson
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
@@ -22,23 +28,43 @@ SLACK_API_URL = "https://slack.com/api"
 
 
 class SlackClient:
-    """Slack Web API client for MCP tools."""
+    """Slack Web API client for MCP tools.
+
+    One instance is shared by the process (see ``slack`` below). It speaks
+    HTTP/2 over a pooled connection, so bursts of Slack calls (post, update,
+    react) reuse a single TLS connection. ``close`` releases the connection;
+    the next call opens a fresh one, so the shared instance outlives a server
+    lifespan.
+    """
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
+        self.client = self._connect()
+
+    @staticmethod
+    def _connect() -> httpx.AsyncClient:
+        """Create the pooled HTTP client."""
+        return httpx.AsyncClient(
             base_url=SLACK_API_URL,
             headers={
                 "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
                 "Content-Type": "application/json; charset=utf-8",
             },
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
         )
 
     async def post(self, method: str, **kwargs) -> dict:
-        """Call a Slack API method."""
+        """Call a Slack API method.
+
+        Pass the body as ``json=`` (a dict) or as pre-serialized JSON bytes
+        via ``content=``.
+        """
+        if self.client.is_closed:
+            self.client = self._connect()
         response = await self.client.post(f"/{method}", **kwargs)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("ok"):
             error = data.get("error", "unknown_error")
             raise SlackAPIError(error, data)
@@ -88,9 +114,95 @@ def build_approval_blocks(
     - Classification metadata
     - Action buttons (Approve, Edit, Escalate)
     """
-    confidence_pct = f"{confidence * 100:.0f}%"
-    intent_display = intent.replace("_", " ").title()
+    return _approval_blocks(
+        **_approval_fields(
+            lead_name=lead_name,
+            lead_company=lead_company,
+            lead_email=lead_email,
+            reply_text=reply_text,
+            draft_response=draft_response,
+            intent=intent,
+            confidence=confidence,
+            tier=tier,
+            draft_id=draft_id,
+            expires_at=expires_at,
+        )
+    )
+
+
+def render_approval_blocks(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    reply_text: str,
+    draft_response: str,
+    intent: str,
+    confidence: float,
+    tier: int,
+    draft_id: str,
+    expires_at: str,
+) -> bytes:
+    """
+    Render the Tier 2 approval blocks straight to JSON bytes.
 
+    Equivalent to serializing build_approval_blocks(), but fills the
+    pre-serialized template instead of rebuilding the block dicts.
+    """
+    fields = _approval_fields(
+        lead_name=lead_name,
+        lead_company=lead_company,
+        lead_email=lead_email,
+        reply_text=reply_text,
+        draft_response=draft_response,
+        intent=intent,
+        confidence=confidence,
+        tier=tier,
+        draft_id=draft_id,
+        expires_at=expires_at,
+    )
+    return _render_template(_APPROVAL_TEMPLATE, fields)
+
+
+def _approval_fields(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    reply_text: str,
+    draft_response: str,
+    intent: str,
+    confidence: float,
+    tier: int,
+    draft_id: str,
+    expires_at: str,
+) -> dict[str, str]:
+    """Format the display strings shown in the approval blocks."""
+    return {
+        "lead_name": lead_name,
+        "lead_company": lead_company,
+        "lead_email": lead_email,
+        "intent_display": intent.replace("_", " ").title(),
+        "reply_preview": f"{reply_text[:500]}{'...' if len(reply_text) > 500 else ''}",
+        "draft_preview": f"{draft_response[:800]}{'...' if len(draft_response) > 800 else ''}",
+        "tier": str(tier),
+        "confidence_pct": f"{confidence * 100:.0f}%",
+        "draft_id": draft_id,
+        "expires_at": expires_at,
+    }
+
+
+def _approval_blocks(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    intent_display: str,
+    reply_preview: str,
+    draft_preview: str,
+    tier: str,
+    confidence_pct: str,
+    draft_id: str,
+    expires_at: str,
+) -> list[dict]:
+    """Lay out the approval blocks from pre-formatted display strings."""
     return [
         {
             "type": "header",
@@ -114,14 +226,14 @@ def build_approval_blocks(
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*Their Reply:*\n```{reply_text[:500]}{'...' if len(reply_text) > 500 else ''}```",
+                "text": f"*Their Reply:*\n```{reply_preview}```",
             },
         },
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*Suggested Response:*\n```{draft_response[:800]}{'...' if len(draft_response) > 800 else ''}```",
+                "text": f"*Suggested Response:*\n```{draft_preview}```",
             },
         },
         {
@@ -191,10 +303,92 @@ def build_escalation_blocks(
     - Metadata (sentiment, urgency)
     - Claim button
     """
+    return _escalation_blocks(
+        **_escalation_fields(
+            lead_name=lead_name,
+            lead_company=lead_company,
+            lead_email=lead_email,
+            reply_text=reply_text,
+            reason=reason,
+            intent=intent,
+            sentiment=sentiment,
+            urgency=urgency,
+            escalation_id=escalation_id,
+        )
+    )
+
+
+def render_escalation_blocks(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    reply_text: str,
+    reason: str,
+    intent: str,
+    sentiment: float,
+    urgency: str,
+    escalation_id: str,
+) -> bytes:
+    """
+    Render the Tier 3 escalation blocks straight to JSON bytes.
+
+    Equivalent to serializing build_escalation_blocks(), but fills the
+    pre-serialized template instead of rebuilding the block dicts.
+    """
+    fields = _escalation_fields(
+        lead_name=lead_name,
+        lead_company=lead_company,
+        lead_email=lead_email,
+        reply_text=reply_text,
+        reason=reason,
+        intent=intent,
+        sentiment=sentiment,
+        urgency=urgency,
+        escalation_id=escalation_id,
+    )
+    return _render_template(_ESCALATION_TEMPLATE, fields)
+
+
+def _escalation_fields(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    reply_text: str,
+    reason: str,
+    intent: str,
+    sentiment: float,
+    urgency: str,
+    escalation_id: str,
+) -> dict[str, str]:
+    """Format the display strings shown in the escalation blocks."""
     sentiment_display = "Positive" if sentiment > 0.3 else "Negative" if sentiment < -0.3 else "Neutral"
-    intent_display = intent.replace("_", " ").title()
     urgency_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(urgency, "⚪")
 
+    return {
+        "lead_name": lead_name,
+        "lead_company": lead_company,
+        "lead_email": lead_email,
+        "reply_text": reply_text,
+        "reason": reason,
+        "intent_display": intent.replace("_", " ").title(),
+        "urgency_label": f"{urgency_emoji} {urgency.title()} Urgency",
+        "sentiment_label": f"{sentiment_display} ({sentiment:.2f})",
+        "escalation_id": escalation_id,
+    }
+
+
+def _escalation_blocks(
+    lead_name: str,
+    lead_company: str,
+    lead_email: str,
+    reply_text: str,
+    reason: str,
+    intent_display: str,
+    urgency_label: str,
+    sentiment_label: str,
+    escalation_id: str,
+) -> list[dict]:
+    """Lay out the escalation blocks from pre-formatted display strings."""
     return [
         {
             "type": "header",
@@ -233,7 +427,7 @@ def build_escalation_blocks(
             "elements": [
                 {
                     "type": "mrkdwn",
-                    "text": f"{urgency_emoji} {urgency.title()} Urgency | Sentiment: {sentiment_display} ({sentiment:.2f})",
+                    "text": f"{urgency_label} | Sentiment: {sentiment_label}",
                 }
             ],
         },
@@ -254,6 +448,13 @@ def build_escalation_blocks(
     ]
 
 
+@lru_cache(maxsize=1)
+def _utc_minute_label(minute: int) -> str:
+    """Format a Unix minute as 'YYYY-MM-DD HH:MM UTC', cached per minute."""
+    t = time.gmtime(minute * 60)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d} UTC"
+
+
 def build_status_update_blocks(
     draft_id: str,
     status: str,
@@ -291,7 +492,7 @@ def build_status_update_blocks(
             "elements": [
                 {
                     "type": "mrkdwn",
-                    "text": f"{status_emoji} *{status_text}*{resolver_text} at {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
+                    "text": f"{status_emoji} *{status_text}*{resolver_text} at {_utc_minute_label(int(time.time()) // 60)}",
                 }
             ],
         }
@@ -300,6 +501,160 @@ def build_status_update_blocks(
     return blocks
 
 
+# ===========================================
+# Pre-serialized Block Kit Templates
+# ===========================================
+
+_PLACEHOLDER = re.compile(rb"\{([a-z_]+)\}")
+
+
+def _serialize_template(build_blocks, field_names: tuple[str, ...]) -> bytes:
+    """Serialize a block layout with a {field} placeholder in every field."""
+    return orjson.dumps(build_blocks(**{name: f"{{{name}}}" for name in field_names}))
+
+
+def _render_template(template: bytes, fields: dict[str, str]) -> bytes:
+    """Fill a serialized template in one pass, JSON-escaping each value.
+
+    Filled values are never rescanned, so user text that looks like a
+    placeholder is left alone.
+    """
+    encoded = {name.encode(): orjson.dumps(value)[1:-1] for name, value in fields.items()}
+    return _PLACEHOLDER.sub(lambda match: encoded[match.group(1)], template)
+
+
+def _message_payload(channel: str, text: str, blocks_json: bytes) -> bytes:
+    """Build a chat.postMessage body around pre-serialized blocks."""
+    return b"".join(
+        (
+            b'{"channel":',
+            orjson.dumps(channel),
+            b',"text":',
+            orjson.dumps(text),
+            b',"blocks":',
+            blocks_json,
+            b"}",
+        )
+    )
+
+
+_APPROVAL_TEMPLATE = _serialize_template(
+    _approval_blocks, tuple(inspect.signature(_approval_blocks).parameters)
+)
+_ESCALATION_TEMPLATE = _serialize_template(
+    _escalation_blocks, tuple(inspect.signature(_escalation_blocks).parameters)
+)
+
+
+# ===========================================
+# Posted Message Cache
+# ===========================================
+
+# Blocks of messages this process posted, keyed by (channel, ts), so that
+# slack_resolve_approval can skip the conversations.history round-trip.
+# Values are block dicts or the JSON bytes that were sent.
+POSTED_BLOCKS_MAXSIZE = 4096
+POSTED_BLOCKS_TTL_SECONDS = 24 * 60 * 60
+
+_posted_blocks: OrderedDict[tuple[str, str], tuple[float, list[dict] | bytes]] = OrderedDict()
+
+
+def _remember_blocks(channel: str | None, ts: str | None, blocks: list[dict] | bytes) -> None:
+    """Cache the blocks of a message that was just posted or updated."""
+    if not channel or not ts:
+        return
+    key = (channel, ts)
+    _posted_blocks[key] = (time.monotonic() + POSTED_BLOCKS_TTL_SECONDS, blocks)
+    _posted_blocks.move_to_end(key)
+    while len(_posted_blocks) > POSTED_BLOCKS_MAXSIZE:
+        _posted_blocks.popitem(last=False)
+
+
+def _recall_blocks(channel: str, ts: str) -> list[dict] | None:
+    """Return cached blocks for a message, or None if unknown or expired."""
+    entry = _posted_blocks.get((channel, ts))
+    if entry is None:
+        return None
+    expires_at, blocks = entry
+    if expires_at <= time.monotonic():
+        del _posted_blocks[(channel, ts)]
+        return None
+    if isinstance(blocks, bytes):
+        return orjson.loads(blocks)
+    return blocks
+
+
+# ===========================================
+# Approval Resolution
+# ===========================================
+
+# Concurrent chat.update calls per bulk resolution (Slack tier 3 allows ~50/min)
+BULK_RESOLVE_CONCURRENCY = 20
+
+
+class ApprovalResolution(BaseModel):
+    """One approval message to resolve in slack_resolve_approvals_bulk."""
+
+    channel: str = Field(description="Channel ID where the message is")
+    ts: str = Field(description="Timestamp of the message to update")
+    draft_id: str = Field(description="Draft identifier")
+    status: str = Field(
+        description="Resolution status (approved, approved_edited, rejected, escalated, expired)"
+    )
+    resolved_by: Optional[str] = Field(default=None, description="Slack user ID who resolved it")
+
+
+async def _resolve_approval(
+    channel: str,
+    ts: str,
+    draft_id: str,
+    status: str,
+    resolved_by: Optional[str] = None,
+) -> dict:
+    """Replace an approval message's action buttons with its resolution status."""
+    # Get the original blocks, from Slack only if this process didn't post them
+    original_blocks = _recall_blocks(channel, ts)
+    if original_blocks is None:
+        get_response = await slack.post(
+            "conversations.history",
+            json={
+                "channel": channel,
+                "latest": ts,
+                "limit": 1,
+                "inclusive": True,
+            },
+        )
+
+        messages = get_response.get("messages", [])
+        if messages:
+            original_blocks = messages[0].get("blocks")
+
+    updated_blocks = build_status_update_blocks(
+        draft_id=draft_id,
+        status=status,
+        resolved_by=resolved_by,
+        original_blocks=original_blocks,
+    )
+
+    status_text = status.replace("_", " ").title()
+    fallback_text = f"Draft {status_text}"
+
+    payload = {
+        "channel": channel,
+        "ts": ts,
+        "text": fallback_text,
+        "blocks": updated_blocks,
+    }
+    response = await slack.post("chat.update", json=payload)
+    _remember_blocks(response.get("channel"), response.get("ts"), updated_blocks)
+    return {
+        "ok": True,
+        "channel": response.get("channel"),
+        "ts": response.get("ts"),
+        "message": response.get("message"),
+    }
+
+
 # ===========================================
 # Tool Registration
 # ===========================================
@@ -368,6 +723,7 @@ def register_slack_tools(mcp: FastMCP) -> None:
             payload["thread_ts"] = thread_ts
 
         response = await slack.post("chat.postMessage", json=payload)
+        _remember_blocks(response.get("channel"), response.get("ts"), blocks)
         return {
             "ok": True,
             "channel": response.get("channel"),
@@ -404,6 +760,8 @@ def register_slack_tools(mcp: FastMCP) -> None:
             payload["blocks"] = blocks
 
         response = await slack.post("chat.update", json=payload)
+        if blocks:
+            _remember_blocks(response.get("channel"), response.get("ts"), blocks)
         return {
             "ok": True,
             "channel": response.get("channel"),
@@ -447,7 +805,7 @@ def register_slack_tools(mcp: FastMCP) -> None:
         Returns:
             Slack API response with channel, ts, and message
         """
-        blocks = build_approval_blocks(
+        blocks_json = render_approval_blocks(
             lead_name=lead_name,
             lead_company=lead_company,
             lead_email=lead_email,
@@ -463,12 +821,9 @@ def register_slack_tools(mcp: FastMCP) -> None:
         fallback_text = f"New reply from {lead_name} at {lead_company} requires approval"
 
         # Call Slack API directly (not via slack_post_blocks tool to avoid FunctionTool issue)
-        payload = {
-            "channel": channel,
-            "blocks": blocks,
-            "text": fallback_text,
-        }
-        response = await slack.post("chat.postMessage", json=payload)
+        payload = _message_payload(channel, fallback_text, blocks_json)
+        response = await slack.post("chat.postMessage", content=payload)
+        _remember_blocks(response.get("channel"), response.get("ts"), blocks_json)
         return {
             "ok": True,
             "channel": response.get("channel"),
@@ -510,7 +865,7 @@ def register_slack_tools(mcp: FastMCP) -> None:
         Returns:
             Slack API response with channel, ts, and message
         """
-        blocks = build_escalation_blocks(
+        blocks_json = render_escalation_blocks(
             lead_name=lead_name,
             lead_company=lead_company,
             lead_email=lead_email,
@@ -525,12 +880,9 @@ def register_slack_tools(mcp: FastMCP) -> None:
         fallback_text = f"🚨 Escalation: Reply from {lead_name} requires human handling - {reason}"
 
         # Call Slack API directly (not via slack_post_blocks tool to avoid FunctionTool issue)
-        payload = {
-            "channel": channel,
-            "blocks": blocks,
-            "text": fallback_text,
-        }
-        response = await slack.post("chat.postMessage", json=payload)
+        payload = _message_payload(channel, fallback_text, blocks_json)
+        response = await slack.post("chat.postMessage", content=payload)
+        _remember_blocks(response.get("channel"), response.get("ts"), blocks_json)
         return {
             "ok": True,
             "channel": response.get("channel"),
@@ -561,46 +913,51 @@ def register_slack_tools(mcp: FastMCP) -> None:
         Returns:
             Slack API response with updated message
         """
-        # Get the original message to preserve blocks
-        get_response = await slack.post(
-            "conversations.history",
-            json={
-                "channel": channel,
-                "latest": ts,
-                "limit": 1,
-                "inclusive": True,
-            },
-        )
+        return await _resolve_approval(channel, ts, draft_id, status, resolved_by)
 
-        original_blocks = None
-        messages = get_response.get("messages", [])
-        if messages:
-            original_blocks = messages[0].get("blocks")
+    @mcp.tool()
+    async def slack_resolve_approvals_bulk(
+        items: list[ApprovalResolution],
+    ) -> list[dict]:
+        """
+        Resolve many approval messages at once (e.g. an expiry sweep).
 
-        updated_blocks = build_status_update_blocks(
-            draft_id=draft_id,
-            status=status,
-            resolved_by=resolved_by,
-            original_blocks=original_blocks,
-        )
+        Updates run concurrently on the shared Slack connection, at most
+        BULK_RESOLVE_CONCURRENCY at a time. A failed item does not stop the
+        others; it is reported with ok=False and the Slack or transport error.
 
-        status_text = status.replace("_", " ").title()
-        fallback_text = f"Draft {status_text}"
+        Args:
+            items: Messages to resolve, each with channel, ts, draft_id,
+                status and optional resolved_by
 
-        # Call Slack API directly (not via slack_update_message tool to avoid FunctionTool issue)
-        payload = {
-            "channel": channel,
-            "ts": ts,
-            "text": fallback_text,
-            "blocks": updated_blocks,
-        }
-        response = await slack.post("chat.update", json=payload)
-        return {
-            "ok": True,
-            "channel": response.get("channel"),
-            "ts": response.get("ts"),
-            "message": response.get("message"),
-        }
+        Returns:
+            One result per item, in input order
+        """
+        semaphore = asyncio.Semaphore(BULK_RESOLVE_CONCURRENCY)
+
+        async def resolve_one(item: ApprovalResolution) -> dict:
+            async with semaphore:
+                try:
+                    return await _resolve_approval(
+                        item.channel, item.ts, item.draft_id, item.status, item.resolved_by
+                    )
+                except SlackAPIError as e:
+                    return {
+                        "ok": False,
+                        "channel": item.channel,
+                        "ts": item.ts,
+                        "error": e.error,
+                    }
+                except httpx.HTTPError as e:
+                    # Timeouts and connection failures, or a non-2xx status
+                    return {
+                        "ok": False,
+                        "channel": item.channel,
+                        "ts": item.ts,
+                        "error": str(e) or type(e).__name__,
+                    }
+
+        return list(await asyncio.gather(*(resolve_one(item) for item in items)))
 
     @mcp.tool()
     async def slack_add_reaction(
@@ -1,6 +1,8 @@
 """Shared test fixtures for MCP server tests."""
 
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -16,23 +18,38 @@ TEST_BRAIN_ID = "brain_test_v1"
 TEST_VERTICAL = "test"
 QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
 QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
+QDRANT_FORCE_HTTP = os.getenv("QDRANT_FORCE_HTTP") == "1"
 
 
+@lru_cache(maxsize=1)
 def _create_qdrant_client() -> QdrantClient:
-    """Create a Qdrant client with proper configuration."""
-    # Use url parameter to explicitly specify HTTP (not HTTPS)
+    """Create the shared test Qdrant client with proper configuration.
+
+    Matches the server's quality gate client: gRPC unless QDRANT_FORCE_HTTP=1.
+    """
+    if QDRANT_FORCE_HTTP:
+        # Use url parameter to explicitly specify HTTP (not HTTPS)
+        return QdrantClient(
+            url=f"http://{QDRANT_HOST}:{QDRANT_PORT}",
+            api_key=QDRANT_API_KEY,
+        )
     return QdrantClient(
-        url=f"http://{QDRANT_HOST}:{QDRANT_PORT}",
+        host=QDRANT_HOST,
+        port=QDRANT_PORT,
+        grpc_port=QDRANT_GRPC_PORT,
+        prefer_grpc=True,
+        https=False,
         api_key=QDRANT_API_KEY,
     )
 
 
+@lru_cache(maxsize=1)
 def is_qdrant_available() -> bool:
-    """Check if Qdrant is running and accessible."""
+    """Check once per session if Qdrant is running and accessible."""
     try:
-        client = _create_qdrant_client()
-        client.get_collections()
+        _create_qdrant_client().get_collections()
         return True
     except Exception:
         return False
@@ -44,6 +61,15 @@ requires_qdrant = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_quality_gate_caches():
+    """Keep cached duplicate decisions from leaking between tests."""
+    yield
+    quality_gates = sys.modules.get("atlas_gtm_mcp.qdrant.quality_gates")
+    if quality_gates is not None:
+        quality_gates.clear_caches()
+
+
 @pytest.fixture(scope="session")
 def qdrant_client():
     """Session-scoped Qdrant client."""
@@ -0,0 +1,67 @@
+"""Pytest fixtures for Qdrant MCP tool contract tests.
+
+Provides:
+- Mocked sync Qdrant client and embedding functions for the tool module
+- Mocked async Qdrant client and query embedding for the quality gates
+- An MCP server with the Qdrant tools registered, plus a tool lookup helper
+
+Fixtures are module-scoped: each test module patches once and shares the
+server, and the patches are undone before the next module runs.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastmcp import FastMCP
+
+# Import the registration function
+from atlas_gtm_mcp.qdrant import quality_gates, register_qdrant_tools
+
+# Shared fake embedding; the tools under test only read it
+EMBEDDING = [0.1] * 512  # 512-dim vector
+
+
+@pytest.fixture(scope="module")
+def mock_qdrant():
+    """Mock Qdrant client, shared by every test in the module."""
+    with patch("atlas_gtm_mcp.qdrant.QdrantClient") as mock:
+        client = MagicMock()
+        mock.return_value = client
+        yield client
+
+
+@pytest.fixture(scope="module")
+def mock_embeddings():
+    """Mock embedding functions."""
+    with patch("atlas_gtm_mcp.qdrant.embed_query") as mock_query, patch(
+        "atlas_gtm_mcp.qdrant.embed_document"
+    ) as mock_doc:
+        mock_query.return_value = EMBEDDING
+        mock_doc.return_value = EMBEDDING
+        yield mock_query, mock_doc
+
+
+@pytest.fixture(scope="module")
+def mcp_server(mock_qdrant, mock_embeddings):
+    """Create MCP server with registered tools."""
+    mcp = FastMCP("test-server")
+    register_qdrant_tools(mcp)
+    return mcp
+
+
+@pytest.fixture(scope="module")
+def tool(mcp_server):
+    """Look up a registered tool's function by name."""
+    tools = mcp_server._tool_manager._tools
+    return lambda name: tools[name].fn
+
+
+@pytest.fixture(scope="module")
+def mock_qg_qdrant():
+    """Mock the quality gate's async Qdrant client and query embedding."""
+    client = AsyncMock()
+    # Plain attribute swaps: nothing inspects calls on these two functions
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(quality_gates, "_get_qdrant_client", lambda: client)
+        mp.setattr(quality_gates, "embed_query", lambda *args, **kwargs: EMBEDDING)
+        yield client
@@ -10,9 +10,11 @@ without requiring a live Slack workspace. They use mocks to verify:
 - Error handling behavior
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 from fastmcp import FastMCP
 
@@ -22,16 +24,23 @@ from atlas_gtm_mcp.slack import (
     build_approval_blocks,
     build_escalation_blocks,
     build_status_update_blocks,
+    render_approval_blocks,
+    render_escalation_blocks,
+    ApprovalResolution,
     SlackAPIError,
+    SlackClient,
+    _posted_blocks,
 )
 
 
 @pytest.fixture
 def mock_slack_client():
     """Mock Slack HTTP client."""
+    _posted_blocks.clear()
     with patch("atlas_gtm_mcp.slack.slack") as mock:
         mock.post = AsyncMock()
         yield mock
+    _posted_blocks.clear()
 
 
 @pytest.fixture
@@ -236,7 +245,8 @@ class TestSlackPostApprovalRequestContract:
 
         # Verify blocks were sent
         call_kwargs = mock_slack_client.post.call_args[1]
-        payload = call_kwargs.get("json", {})
+        payload = orjson.loads(call_kwargs["content"])
+        assert payload["channel"] == "C01234567"
         assert "blocks" in payload
         blocks = payload["blocks"]
 
@@ -282,7 +292,7 @@ class TestSlackPostEscalationContract:
 
         # Verify blocks were sent
         call_kwargs = mock_slack_client.post.call_args[1]
-        payload = call_kwargs.get("json", {})
+        payload = orjson.loads(call_kwargs["content"])
         assert "blocks" in payload
 
         # Verify fallback text contains escalation marker
@@ -330,6 +340,95 @@ class TestSlackResolveApprovalContract:
 
         assert result["ok"] is True
 
+    @pytest.mark.asyncio
+    async def test_uses_cached_blocks_for_own_post(self, mcp_server, mock_slack_client):
+        """Test resolving a message this process posted skips conversations.history."""
+        mock_slack_client.post.return_value = {
+            "ok": True,
+            "channel": "C01234567",
+            "ts": "1234567890.123456",
+            "message": {},
+        }
+        tools = mcp_server._tool_manager._tools
+
+        await tools.get("slack_post_blocks").fn(
+            channel="C01234567",
+            blocks=[
+                {"type": "header", "text": {"type": "plain_text", "text": "Test"}},
+                {"type": "actions", "elements": []},
+            ],
+            text="Fallback",
+        )
+        await tools.get("slack_resolve_approval").fn(
+            channel="C01234567",
+            ts="1234567890.123456",
+            draft_id="draft_123",
+            status="approved",
+        )
+
+        methods = [call.args[0] for call in mock_slack_client.post.call_args_list]
+        assert methods == ["chat.postMessage", "chat.update"]
+        update_blocks = mock_slack_client.post.call_args[1]["json"]["blocks"]
+        assert update_blocks[0]["type"] == "header"
+        assert all(block["type"] != "actions" for block in update_blocks)
+
+
+class TestSlackResolveApprovalsBulkContract:
+    """Contract tests for slack_resolve_approvals_bulk tool."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_each_item(self, mcp_server, mock_slack_client):
+        """Test every item is resolved and failures are reported per item."""
+
+        async def post(method, **kwargs):
+            if method == "conversations.history":
+                return {"ok": True, "messages": [{"blocks": [{"type": "actions"}]}]}
+            if kwargs["json"]["ts"] == "2.0":
+                raise SlackAPIError("message_not_found", {"ok": False})
+            return {"ok": True, "channel": kwargs["json"]["channel"], "ts": kwargs["json"]["ts"]}
+
+        mock_slack_client.post.side_effect = post
+
+        tools = mcp_server._tool_manager._tools
+        tool = tools.get("slack_resolve_approvals_bulk")
+        assert tool is not None, "slack_resolve_approvals_bulk tool should be registered"
+
+        result = await tool.fn(
+            items=[
+                ApprovalResolution(channel="C01234567", ts="1.0", draft_id="d1", status="expired"),
+                ApprovalResolution(channel="C01234567", ts="2.0", draft_id="d2", status="expired"),
+            ]
+        )
+
+        assert [item["ok"] for item in result] == [True, False]
+        assert result[0]["ts"] == "1.0"
+        assert result[1]["error"] == "message_not_found"
+
+    @pytest.mark.asyncio
+    async def test_transport_error_reported_per_item(self, mcp_server, mock_slack_client):
+        """Test a transport failure on one item does not fail the others."""
+
+        async def post(method, **kwargs):
+            if method == "conversations.history":
+                return {"ok": True, "messages": [{"blocks": [{"type": "actions"}]}]}
+            if kwargs["json"]["ts"] == "2.0":
+                raise httpx.ReadTimeout("timed out")
+            return {"ok": True, "channel": kwargs["json"]["channel"], "ts": kwargs["json"]["ts"]}
+
+        mock_slack_client.post.side_effect = post
+        tool = mcp_server._tool_manager._tools["slack_resolve_approvals_bulk"]
+
+        result = await tool.fn(
+            items=[
+                ApprovalResolution(channel="C01234567", ts="1.0", draft_id="d1", status="expired"),
+                ApprovalResolution(channel="C01234567", ts="2.0", draft_id="d2", status="expired"),
+            ]
+        )
+
+        assert [item["ok"] for item in result] == [True, False]
+        assert result[1]["ts"] == "2.0"
+        assert result[1]["error"] == "timed out"
+
 
 class TestBlockKitBuilders:
     """Tests for Block Kit builder functions."""
@@ -470,6 +569,15 @@ class TestBlockKitBuilders:
         assert "Approved Edited" in context_text
         assert "U01234567" in context_text
 
+    def test_build_status_update_blocks_utc_timestamp(self):
+        """Test resolution context ends with the current UTC minute."""
+        before = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        updated_blocks = build_status_update_blocks(draft_id="draft_123", status="approved")
+        after = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+        context_text = updated_blocks[-1]["elements"][0]["text"]
+        assert context_text.endswith((before, after))
+
     def test_build_status_update_blocks_status_emojis(self):
         """Test each status has appropriate emoji."""
         statuses = {
@@ -491,6 +599,43 @@ class TestBlockKitBuilders:
             assert expected_emoji in block_str, f"Status {status} should have emoji {expected_emoji}"
 
 
+class TestRenderedBlocks:
+    """Tests for the pre-serialized Block Kit templates."""
+
+    def test_render_approval_matches_builder(self):
+        """Test rendered approval JSON equals the dict builder output."""
+        kwargs = dict(
+            lead_name='John "JJ" Smith {lead_company}',
+            lead_company="Acme\\Corp",
+            lead_email="john@acme.com",
+            reply_text="Line one\nLine two " + "x" * 600,
+            draft_response="Hi John, thanks for your interest!",
+            intent="positive_interest",
+            confidence=0.82,
+            tier=2,
+            draft_id="draft_123",
+            expires_at="2024-01-15T18:00:00Z",
+        )
+        rendered = orjson.loads(render_approval_blocks(**kwargs))
+        assert rendered == build_approval_blocks(**kwargs)
+
+    def test_render_escalation_matches_builder(self):
+        """Test rendered escalation JSON equals the dict builder output."""
+        kwargs = dict(
+            lead_name="Jane Doe",
+            lead_company="Beta Inc",
+            lead_email="jane@beta.com",
+            reply_text='I\'m "very" frustrated {reason}',
+            reason="Negative sentiment",
+            intent="objection",
+            sentiment=-0.8,
+            urgency="high",
+            escalation_id="esc_456",
+        )
+        rendered = orjson.loads(render_escalation_blocks(**kwargs))
+        assert rendered == build_escalation_blocks(**kwargs)
+
+
 class TestSlackAPIError:
     """Tests for SlackAPIError exception."""
 
@@ -501,3 +646,63 @@ class TestSlackAPIError:
         assert error.error == "channel_not_found"
         assert "channel_not_found" in str(error)
         assert error.response == {"ok": False, "error": "channel_not_found"}
+
+
+class TestSlackClient:
+    """Tests for SlackClient response handling."""
+
+    @pytest.mark.asyncio
+    async def test_post_parses_response(self):
+        """Test a successful response body is decoded into a dict."""
+        client = SlackClient()
+        client.client = httpx.AsyncClient(
+            base_url="https://slack.test/api",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200, content=b'{"ok":true,"channel":"C01234567","ts":"1.2"}'
+                )
+            ),
+        )
+
+        data = await client.post("chat.postMessage", json={"channel": "C01234567"})
+        await client.close()
+
+        assert data == {"ok": True, "channel": "C01234567", "ts": "1.2"}
+
+    @pytest.mark.asyncio
+    async def test_post_raises_on_not_ok(self):
+        """Test ok=false responses raise SlackAPIError."""
+        client = SlackClient()
+        client.client = httpx.AsyncClient(
+            base_url="https://slack.test/api",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=b'{"ok":false,"error":"not_in_channel"}')
+            ),
+        )
+
+        with pytest.raises(SlackAPIError) as exc_info:
+            await client.post("chat.postMessage", json={"channel": "C01234567"})
+        await client.close()
+
+        assert exc_info.value.error == "not_in_channel"
+
+    @pytest.mark.asyncio
+    async def test_post_reconnects_after_close(self, monkeypatch):
+        """Test a closed client opens a new connection on the next call."""
+        client = SlackClient()
+        await client.close()
+        monkeypatch.setattr(
+            client,
+            "_connect",
+            lambda: httpx.AsyncClient(
+                base_url="https://slack.test/api",
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, content=b'{"ok":true}')
+                ),
+            ),
+        )
+
+        data = await client.post("auth.test")
+        await client.close()
+
+        assert data == {"ok": True}
@@ -9,128 +9,278 @@ without requiring a live Qdrant instance. They use mocks to verify:
 - Error handling behavior
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
-from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 
-# Import the registration function
-from atlas_gtm_mcp.qdrant import register_qdrant_tools
-
-
-@pytest.fixture
-def mock_qdrant():
-    """Mock Qdrant client."""
-    with patch("atlas_gtm_mcp.qdrant.QdrantClient") as mock:
-        client = MagicMock()
-        mock.return_value = client
-        yield client
-
-
-@pytest.fixture
-def mock_embeddings():
-    """Mock embedding functions."""
-    with patch("atlas_gtm_mcp.qdrant.embed_query") as mock_query, patch(
-        "atlas_gtm_mcp.qdrant.embed_document"
-    ) as mock_doc:
-        mock_query.return_value = [0.1] * 512  # 512-dim vector
-        mock_doc.return_value = [0.1] * 512
-        yield mock_query, mock_doc
-
-
-@pytest.fixture
-def mcp_server(mock_qdrant, mock_embeddings):
-    """Create MCP server with registered tools."""
-    mcp = FastMCP("test-server")
-    register_qdrant_tools(mcp)
-    return mcp
-
-
-class TestQueryICPRulesContract:
-    """Contract tests for query_icp_rules tool."""
+# Share one worker, and so one set of module-scoped mocks, under xdist
+pytestmark = pytest.mark.xdist_group("qdrant_contracts")
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_qdrant(mock_qdrant, mock_qg_qdrant):
+    """Clear calls and canned responses left on the shared clients by the previous test."""
+    yield
+    mock_qdrant.reset_mock(return_value=True, side_effect=True)
+    mock_qg_qdrant.reset_mock(return_value=True, side_effect=True)
+
+
+# Keys each read tool's result must contain
+_ICP_RULE_KEYS = frozenset(
+    {
+        "id",
+        "score",
+        "category",
+        "attribute",
+        "condition",
+        "score_weight",
+        "is_knockout",
+        "reasoning",
+    }
+)
+_TEMPLATE_KEYS = frozenset(
+    {
+        "id",
+        "reply_type",
+        "tier",
+        "template_text",
+        "variables",
+        "personalization_instructions",
+    }
+)
+_HANDLER_KEYS = frozenset(
+    {
+        "id",
+        "confidence",
+        "objection_type",
+        "handler_strategy",
+        "handler_response",
+        "variables",
+        "follow_up_actions",
+    }
+)
+_RESEARCH_KEYS = frozenset(
+    {
+        "id",
+        "score",
+        "content_type",
+        "title",
+        "content",
+        "key_facts",
+        "source_url",
+    }
+)
+_BRAIN_KEYS = frozenset({"id", "name", "vertical", "status", "config", "stats"})
+_BRAIN_LIST_KEYS = frozenset({"id"})
+
+# Canned point payloads, read-only and shared across tests
+_ICP_PAYLOAD = MappingProxyType(
+    {
+        "category": "firmographic",
+        "attribute": "company_size",
+        "display_name": "Company Size",
+        "condition": {"type": "range", "min": 50, "max": 500},
+        "score_weight": 30,
+        "is_knockout": False,
+        "reasoning": "Sweet spot for adoption",
+    }
+)
+_TEMPLATE_PAYLOAD = MappingProxyType(
+    {
+        "reply_type": "positive_interest",
+        "tier": 1,
+        "template_text": "Thanks {{first_name}}!",
+        "variables": ["first_name"],
+        "personalization_instructions": "Be friendly",
+    }
+)
+_HANDLER_PAYLOAD = MappingProxyType(
+    {
+        "objection_type": "pricing",
+        "handler_strategy": "roi_reframe",
+        "handler_response": "I understand budget is key...",
+        "variables": ["first_name"],
+        "follow_up_actions": ["send_case_study"],
+    }
+)
+_RESEARCH_PAYLOAD = MappingProxyType(
+    {
+        "content_type": "market_overview",
+        "title": "IRO Market Overview",
+        "content": "The market is...",
+        "key_facts": ["Fact 1", "Fact 2"],
+        "source_url": "https://example.com",
+    }
+)
+_BRAIN_PAYLOAD = MappingProxyType(
+    {
+        "name": "IRO Brain",
+        "vertical": "iro",
+        "version": "1.0",
+        "status": "active",
+        "description": "IR Operations brain",
+        "config": {
+            "default_tier_thresholds": {"high": 70, "low": 50},
+            "auto_response_enabled": True,
+            "learning_enabled": True,
+            "quality_gate_threshold": 0.7,
+        },
+        "stats": {
+            "icp_rules_count": 47,
+            "templates_count": 52,
+            "handlers_count": 23,
+            "research_docs_count": 156,
+            "insights_count": 0,
+        },
+        "created_at": "2025-01-15T00:00:00Z",
+        "updated_at": "2025-01-15T00:00:00Z",
+    }
+)
+_BRAIN_LIST_PAYLOAD = MappingProxyType({"name": "IRO Brain", "status": "active"})
+
+# Contract shapes: (tool, kwargs, client method, canned response, expected keys, returns list)
+CONTRACT_CASES = [
+    pytest.param(
+        "query_icp_rules",
+        {"brain_id": "brain_iro_v1", "query": "company size employees", "limit": 10},
+        "search",
+        [SimpleNamespace(id="rule_001", score=0.89, payload=_ICP_PAYLOAD)],
+        _ICP_RULE_KEYS,
+        True,
+        id="query_icp_rules",
+    ),
+    pytest.param(
+        "get_response_template",
+        {"brain_id": "brain_iro_v1", "reply_type": "positive_interest"},
+        "scroll",
+        (
+            [SimpleNamespace(id="template_001", payload=_TEMPLATE_PAYLOAD)],
+            None,
+        ),
+        _TEMPLATE_KEYS,
+        True,
+        id="get_response_template",
+    ),
+    pytest.param(
+        "find_objection_handler",
+        {"brain_id": "brain_iro_v1", "objection_text": "This is too expensive"},
+        "search",
+        [SimpleNamespace(id="handler_001", score=0.85, payload=_HANDLER_PAYLOAD)],
+        _HANDLER_KEYS,
+        False,
+        id="find_objection_handler",
+    ),
+    pytest.param(
+        "search_market_research",
+        {"brain_id": "brain_iro_v1", "query": "market overview"},
+        "search",
+        [SimpleNamespace(id="research_001", score=0.92, payload=_RESEARCH_PAYLOAD)],
+        _RESEARCH_KEYS,
+        True,
+        id="search_market_research",
+    ),
+    pytest.param(
+        "get_brain",
+        {"vertical": "iro"},
+        "scroll",
+        (
+            [SimpleNamespace(id="brain_iro_v1", payload=_BRAIN_PAYLOAD)],
+            None,
+        ),
+        _BRAIN_KEYS,
+        False,
+        id="get_brain",
+    ),
+    pytest.param(
+        "list_brains",
+        {},
+        "scroll",
+        (
+            [SimpleNamespace(id="brain_iro_v1", payload=_BRAIN_LIST_PAYLOAD)],
+            None,
+        ),
+        _BRAIN_LIST_KEYS,
+        True,
+        id="list_brains",
+    ),
+]
+
+
+# No-match behaviour: (tool, kwargs, check(result, search mock))
+NO_MATCH_CASES = [
+    pytest.param(
+        "query_icp_rules",
+        {"brain_id": "brain_iro_v1", "query": "nonexistent query"},
+        lambda result, search: result == [],
+        id="query_icp_rules-empty_list",
+    ),
+    pytest.param(
+        "find_objection_handler",
+        {"brain_id": "brain_iro_v1", "objection_text": "Random unrelated text"},
+        lambda result, search: result is None,
+        id="find_objection_handler-none_below_threshold",
+    ),
+    pytest.param(
+        "find_objection_handler",
+        {"brain_id": "brain_iro_v1", "objection_text": "test objection"},
+        # 0.70 score_threshold per FR-012
+        lambda result, search: search.call_args[1]["score_threshold"] == 0.70,
+        id="find_objection_handler-070_threshold",
+    ),
+]
+
+
+class TestToolResultShapes:
+    """Contract tests for the result structure of each read tool."""
 
     @pytest.mark.asyncio
-    async def test_returns_list_of_icp_rules(self, mcp_server, mock_qdrant):
-        """Test that query_icp_rules returns list of ICPRuleResult structure."""
-        # Setup mock response
-        mock_hit = MagicMock()
-        mock_hit.id = "rule_001"
-        mock_hit.score = 0.89
-        mock_hit.payload = {
-            "category": "firmographic",
-            "attribute": "company_size",
-            "display_name": "Company Size",
-            "condition": {"type": "range", "min": 50, "max": 500},
-            "score_weight": 30,
-            "is_knockout": False,
-            "reasoning": "Sweet spot for adoption",
-        }
-        mock_qdrant.search.return_value = [mock_hit]
-
-        # Get the tool
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("query_icp_rules")
-        assert tool is not None, "query_icp_rules tool should be registered"
-
-        # Call the tool (through the FastMCP internal mechanism)
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            query="company size employees",
-            limit=10,
-        )
-
-        # Verify structure per ICPRuleResult contract
-        assert isinstance(result, list)
-        assert len(result) == 1
-
-        rule = result[0]
-        assert "id" in rule
-        assert "score" in rule
-        assert "category" in rule
-        assert "attribute" in rule
-        assert "condition" in rule
-        assert "score_weight" in rule
-        assert "is_knockout" in rule
-        assert "reasoning" in rule
+    @pytest.mark.parametrize("name,kwargs,method,response,keys,returns_list", CONTRACT_CASES)
+    async def test_shape(
+        self, tool, mock_qdrant, name, kwargs, method, response, keys, returns_list
+    ):
+        """Test the tool returns the structure its contract specifies."""
+        getattr(mock_qdrant, method).return_value = response
+
+        result = await tool(name)(**kwargs)
+
+        if returns_list:
+            assert isinstance(result, list)
+            assert len(result) == 1
+            result = result[0]
+        assert result is not None
+        assert keys <= result.keys()
 
     @pytest.mark.asyncio
-    async def test_returns_empty_list_for_no_matches(self, mcp_server, mock_qdrant):
-        """Test returns empty list when no matches found."""
+    @pytest.mark.parametrize("name,kwargs,check", NO_MATCH_CASES)
+    async def test_no_matches(self, tool, mock_qdrant, name, kwargs, check):
+        """Test the tool's result and query when the search finds nothing."""
         mock_qdrant.search.return_value = []
 
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("query_icp_rules")
+        result = await tool(name)(**kwargs)
+
+        assert check(result, mock_qdrant.search)
 
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            query="nonexistent query",
-        )
 
-        assert result == []
+class TestQueryICPRulesContract:
+    """Contract tests for query_icp_rules tool."""
 
     @pytest.mark.asyncio
-    async def test_invalid_brain_id_raises_error(self, mcp_server):
+    async def test_invalid_brain_id_raises_error(self, tool):
         """Test invalid brain_id raises ToolError."""
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("query_icp_rules")
-
         with pytest.raises(ToolError) as exc_info:
-            await tool.fn(
+            await tool("query_icp_rules")(
                 brain_id="invalid_format",
                 query="test query",
             )
         assert "Invalid brain_id format" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_category_filter(self, mcp_server, mock_qdrant):
+    async def test_category_filter(self, tool, mock_qdrant):
         """Test category filter is applied."""
         mock_qdrant.search.return_value = []
 
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("query_icp_rules")
-
-        await tool.fn(
+        await tool("query_icp_rules")(
             brain_id="brain_iro_v1",
             query="tech stack",
             category="technographic",
@@ -146,48 +296,11 @@ class TestGetResponseTemplateContract:
     """Contract tests for get_response_template tool."""
 
     @pytest.mark.asyncio
-    async def test_returns_list_of_templates(self, mcp_server, mock_qdrant):
-        """Test that get_response_template returns list of ResponseTemplateResult."""
-        mock_point = MagicMock()
-        mock_point.id = "template_001"
-        mock_point.payload = {
-            "reply_type": "positive_interest",
-            "tier": 1,
-            "template_text": "Thanks {{first_name}}!",
-            "variables": ["first_name"],
-            "personalization_instructions": "Be friendly",
-        }
-        mock_qdrant.scroll.return_value = ([mock_point], None)
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("get_response_template")
-
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            reply_type="positive_interest",
-        )
-
-        # Verify structure per ResponseTemplateResult contract
-        assert isinstance(result, list)
-        assert len(result) == 1
-
-        template = result[0]
-        assert "id" in template
-        assert "reply_type" in template
-        assert "tier" in template
-        assert "template_text" in template
-        assert "variables" in template
-        assert "personalization_instructions" in template
-
-    @pytest.mark.asyncio
-    async def test_auto_send_only_filters_tier_1(self, mcp_server, mock_qdrant):
+    async def test_auto_send_only_filters_tier_1(self, tool, mock_qdrant):
         """Test auto_send_only=True filters for tier=1."""
         mock_qdrant.scroll.return_value = ([], None)
 
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("get_response_template")
-
-        await tool.fn(
+        await tool("get_response_template")(
             brain_id="brain_iro_v1",
             reply_type="positive_interest",
             auto_send_only=True,
@@ -201,155 +314,36 @@ class TestGetResponseTemplateContract:
         assert tier_conditions[0].match.value == 1
 
     @pytest.mark.asyncio
-    async def test_invalid_reply_type_raises_error(self, mcp_server):
+    async def test_invalid_reply_type_raises_error(self, tool):
         """Test invalid reply_type raises ToolError."""
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("get_response_template")
-
         with pytest.raises(ToolError) as exc_info:
-            await tool.fn(
+            await tool("get_response_template")(
                 brain_id="brain_iro_v1",
                 reply_type="invalid_type",
             )
         assert "Invalid reply_type" in str(exc_info.value)
 
 
-class TestFindObjectionHandlerContract:
-    """Contract tests for find_objection_handler tool."""
-
-    @pytest.mark.asyncio
-    async def test_returns_handler_or_none(self, mcp_server, mock_qdrant):
-        """Test returns ObjectionHandlerResult or None."""
-        mock_hit = MagicMock()
-        mock_hit.id = "handler_001"
-        mock_hit.score = 0.85
-        mock_hit.payload = {
-            "objection_type": "pricing",
-            "handler_strategy": "roi_reframe",
-            "handler_response": "I understand budget is key...",
-            "variables": ["first_name"],
-            "follow_up_actions": ["send_case_study"],
-        }
-        mock_qdrant.search.return_value = [mock_hit]
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("find_objection_handler")
-
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            objection_text="This is too expensive",
-        )
-
-        # Verify structure per ObjectionHandlerResult contract
-        assert result is not None
-        assert "id" in result
-        assert "confidence" in result
-        assert "objection_type" in result
-        assert "handler_strategy" in result
-        assert "handler_response" in result
-        assert "variables" in result
-        assert "follow_up_actions" in result
-
-    @pytest.mark.asyncio
-    async def test_returns_none_below_threshold(self, mcp_server, mock_qdrant):
-        """Test returns None when no match meets 0.70 threshold."""
-        mock_qdrant.search.return_value = []  # No matches above threshold
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("find_objection_handler")
-
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            objection_text="Random unrelated text",
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_uses_070_threshold(self, mcp_server, mock_qdrant):
-        """Test uses 0.70 score_threshold per FR-012."""
-        mock_qdrant.search.return_value = []
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("find_objection_handler")
-
-        await tool.fn(
-            brain_id="brain_iro_v1",
-            objection_text="test objection",
-        )
-
-        call_kwargs = mock_qdrant.search.call_args[1]
-        assert call_kwargs["score_threshold"] == 0.70
-
-
-class TestSearchMarketResearchContract:
-    """Contract tests for search_market_research tool."""
-
-    @pytest.mark.asyncio
-    async def test_returns_list_of_research_docs(self, mcp_server, mock_qdrant):
-        """Test returns list of MarketResearchResult."""
-        mock_hit = MagicMock()
-        mock_hit.id = "research_001"
-        mock_hit.score = 0.92
-        mock_hit.payload = {
-            "content_type": "market_overview",
-            "title": "IRO Market Overview",
-            "content": "The market is...",
-            "key_facts": ["Fact 1", "Fact 2"],
-            "source_url": "https://example.com",
-        }
-        mock_qdrant.search.return_value = [mock_hit]
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("search_market_research")
-
-        result = await tool.fn(
-            brain_id="brain_iro_v1",
-            query="market overview",
-        )
-
-        # Verify structure per MarketResearchResult contract
-        assert isinstance(result, list)
-        assert len(result) == 1
-
-        doc = result[0]
-        assert "id" in doc
-        assert "score" in doc
-        assert "content_type" in doc
-        assert "title" in doc
-        assert "content" in doc
-        assert "key_facts" in doc
-        assert "source_url" in doc
-
-
 class TestAddInsightContract:
     """Contract tests for add_insight tool."""
 
     @pytest.mark.asyncio
-    async def test_returns_created_result(self, mcp_server, mock_qdrant):
+    async def test_returns_created_result(self, tool, mock_qdrant, mock_qg_qdrant):
         """Test returns AddInsightResult with created status."""
-        mock_qdrant.search.return_value = []  # No duplicates
         mock_qdrant.upsert.return_value = None
+        mock_qg_qdrant.query_points.return_value = SimpleNamespace(points=[])  # No duplicates
 
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("add_insight")
-
-        # Mock both the quality_gates Qdrant client and embeddings
-        with patch("atlas_gtm_mcp.qdrant.quality_gates._get_qdrant_client") as mock_qg_client, \
-             patch("atlas_gtm_mcp.qdrant.quality_gates.embed_query") as mock_embed:
-            mock_qg_client.return_value = mock_qdrant
-            mock_embed.return_value = [0.1] * 512  # 512-dim vector
-            result = await tool.fn(
-                brain_id="brain_iro_v1",
-                content="This is a meaningful insight about buying process",
-                category="buying_process",
-                importance="high",
-                source={
-                    "type": "call_transcript",
-                    "id": "call_123",
-                    "company_name": "Acme Corp",
-                },
-            )
+        result = await tool("add_insight")(
+            brain_id="brain_iro_v1",
+            content="This is a meaningful insight about buying process",
+            category="buying_process",
+            importance="high",
+            source={
+                "type": "call_transcript",
+                "id": "call_123",
+                "company_name": "Acme Corp",
+            },
+        )
 
         # Verify structure per AddInsightResult contract
         assert result["status"] == "created"
@@ -358,43 +352,30 @@ class TestAddInsightContract:
         assert "needs_validation" in result
 
     @pytest.mark.asyncio
-    async def test_returns_duplicate_result(self, mcp_server, mock_qdrant):
+    async def test_returns_duplicate_result(self, tool, mock_qg_qdrant):
         """Test returns duplicate status when similar insight exists."""
-        mock_hit = MagicMock()
-        mock_hit.id = "existing_insight"
-        mock_hit.score = 0.92
-        mock_qdrant.search.return_value = [mock_hit]
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("add_insight")
-
-        # Mock both the quality_gates Qdrant client and embeddings
-        with patch("atlas_gtm_mcp.qdrant.quality_gates._get_qdrant_client") as mock_qg_client, \
-             patch("atlas_gtm_mcp.qdrant.quality_gates.embed_query") as mock_embed:
-            mock_qg_client.return_value = mock_qdrant
-            mock_embed.return_value = [0.1] * 512  # 512-dim vector
-            result = await tool.fn(
-                brain_id="brain_iro_v1",
-                content="This is a meaningful insight content",
-                category="pain_point",
-                source={
-                    "type": "call_transcript",
-                    "id": "call_123",
-                },
-            )
+        mock_hit = SimpleNamespace(id="existing_insight", score=0.92, vector=[0.1] * 512)
+        mock_qg_qdrant.query_points.return_value = SimpleNamespace(points=[mock_hit])
+
+        result = await tool("add_insight")(
+            brain_id="brain_iro_v1",
+            content="This is a meaningful insight content",
+            category="pain_point",
+            source={
+                "type": "call_transcript",
+                "id": "call_123",
+            },
+        )
 
         assert result["status"] == "duplicate"
         assert "existing_id" in result
         assert "reason" in result
 
     @pytest.mark.asyncio
-    async def test_source_required(self, mcp_server):
+    async def test_source_required(self, tool):
         """Test source metadata is required."""
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("add_insight")
-
         with pytest.raises(ToolError) as exc_info:
-            await tool.fn(
+            await tool("add_insight")(
                 brain_id="brain_iro_v1",
                 content="This is a meaningful insight content",
                 category="pain_point",
@@ -407,73 +388,10 @@ class TestBrainManagementContract:
     """Contract tests for get_brain and list_brains tools."""
 
     @pytest.mark.asyncio
-    async def test_get_brain_returns_brain_result(self, mcp_server, mock_qdrant):
-        """Test get_brain returns BrainResult or None."""
-        mock_point = MagicMock()
-        mock_point.id = "brain_iro_v1"
-        mock_point.payload = {
-            "name": "IRO Brain",
-            "vertical": "iro",
-            "version": "1.0",
-            "status": "active",
-            "description": "IR Operations brain",
-            "config": {
-                "default_tier_thresholds": {"high": 70, "low": 50},
-                "auto_response_enabled": True,
-                "learning_enabled": True,
-                "quality_gate_threshold": 0.7,
-            },
-            "stats": {
-                "icp_rules_count": 47,
-                "templates_count": 52,
-                "handlers_count": 23,
-                "research_docs_count": 156,
-                "insights_count": 0,
-            },
-            "created_at": "2025-01-15T00:00:00Z",
-            "updated_at": "2025-01-15T00:00:00Z",
-        }
-        mock_qdrant.scroll.return_value = ([mock_point], None)
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("get_brain")
-
-        result = await tool.fn(vertical="iro")
-
-        # Verify structure per BrainResult contract
-        assert result is not None
-        assert "id" in result
-        assert "name" in result
-        assert "vertical" in result
-        assert "status" in result
-        assert "config" in result
-        assert "stats" in result
-
-    @pytest.mark.asyncio
-    async def test_get_brain_returns_none_for_missing(self, mcp_server, mock_qdrant):
+    async def test_get_brain_returns_none_for_missing(self, tool, mock_qdrant):
         """Test get_brain returns None when brain not found."""
         mock_qdrant.scroll.return_value = ([], None)
 
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("get_brain")
-
-        result = await tool.fn(vertical="nonexistent")
+        result = await tool("get_brain")(vertical="nonexistent")
 
         assert result is None
-
-    @pytest.mark.asyncio
-    async def test_list_brains_returns_list(self, mcp_server, mock_qdrant):
-        """Test list_brains returns list of BrainResult."""
-        mock_point = MagicMock()
-        mock_point.id = "brain_iro_v1"
-        mock_point.payload = {"name": "IRO Brain", "status": "active"}
-        mock_qdrant.scroll.return_value = ([mock_point], None)
-
-        tools = mcp_server._tool_manager._tools
-        tool = tools.get("list_brains")
-
-        result = await tool.fn()
-
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert "id" in result[0]
@@ -9,14 +9,15 @@ Provides:
 
 from __future__ import annotations
 
-import os
+import json
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING, Any
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Mapping
 
 
 # =============================================================================
@@ -25,11 +26,11 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture
-def env_api_key() -> Generator[str, None, None]:
+def env_api_key(monkeypatch: pytest.MonkeyPatch) -> str:
     """Provide a test API key via environment variable."""
     test_key = "test_instantly_api_key_12345"
-    with patch.dict(os.environ, {"INSTANTLY_API_KEY": test_key}):
-        yield test_key
+    monkeypatch.setenv("INSTANTLY_API_KEY", test_key)
+    return test_key
 
 
 @pytest.fixture
@@ -43,185 +44,227 @@ def env_vars(env_api_key: str) -> Generator[dict[str, str], None, None]:
 # =============================================================================
 
 
-@pytest.fixture
-def sample_campaign() -> dict[str, Any]:
+def _freeze(value: Any) -> Any:
+    """Recursively make a sample payload read-only (dicts -> proxies, lists -> tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Static Instantly API payloads shared by the sample_* fixtures. They are frozen
+# so a test that mutates one fails loudly; take dict(sample_x) for a copy.
+_SAMPLES: dict[str, Mapping[str, Any]] = {
+    "campaign": _freeze(
+        {
+            "id": "camp_12345678901234567890",
+            "name": "Q1 Outreach Campaign",
+            "status": "ACTIVE",
+            "created_at": "2024-01-15T10:30:00.000Z",
+            "account_ids": ["acc_sender_12345"],
+            "leads_count": 150,
+            "emails_sent": 75,
+            "emails_opened": 45,
+            "replies": 12,
+        }
+    ),
+    "campaign_list": _freeze(
+        {
+            "items": [
+                {
+                    "id": "camp_12345678901234567890",
+                    "name": "Q1 Outreach Campaign",
+                    "status": "ACTIVE",
+                    "leads_count": 150,
+                },
+                {
+                    "id": "camp_22345678901234567891",
+                    "name": "Product Launch",
+                    "status": "PAUSED",
+                    "leads_count": 300,
+                },
+            ],
+            "total": 2,
+            "skip": 0,
+            "limit": 100,
+        }
+    ),
+    "lead": _freeze(
+        {
+            "email": "john.doe@example.com",
+            "first_name": "John",
+            "last_name": "Doe",
+            "company": "Example Corp",
+            "title": "VP of Engineering",
+            "campaign_id": "camp_12345678901234567890",
+            "status": "CONTACTED",
+            "custom_variables": {"industry": "Technology"},
+            "created_at": "2024-01-16T09:00:00.000Z",
+        }
+    ),
+    "lead_list": _freeze(
+        {
+            "items": [
+                {
+                    "email": "john.doe@example.com",
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "status": "CONTACTED",
+                },
+                {
+                    "email": "jane.smith@example.com",
+                    "first_name": "Jane",
+                    "last_name": "Smith",
+                    "status": "REPLIED",
+                },
+            ],
+            "total": 2,
+        }
+    ),
+    "email_thread": _freeze(
+        {
+            "thread_id": "thread_12345678901234567890",
+            "lead_email": "john.doe@example.com",
+            "campaign_id": "camp_12345678901234567890",
+            "messages": [
+                {
+                    "id": "msg_001",
+                    "from": "sender@company.com",
+                    "to": "john.doe@example.com",
+                    "subject": "Introducing our solution",
+                    "body": "Hi John, I wanted to reach out...",
+                    "sent_at": "2024-01-16T10:00:00.000Z",
+                    "type": "outbound",
+                },
+                {
+                    "id": "msg_002",
+                    "from": "john.doe@example.com",
+                    "to": "sender@company.com",
+                    "subject": "Re: Introducing our solution",
+                    "body": "Thanks for reaching out. I'd love to learn more...",
+                    "sent_at": "2024-01-16T14:30:00.000Z",
+                    "type": "inbound",
+                },
+            ],
+        }
+    ),
+    "account": _freeze(
+        {
+            "id": "acc_sender_12345",
+            "email": "sender@company.com",
+            "name": "Sales Sender Account",
+            "status": "ACTIVE",
+            "warmup_status": "COMPLETED",
+            "daily_limit": 50,
+            "sent_today": 23,
+            "health_score": 95,
+            "created_at": "2024-01-01T00:00:00.000Z",
+        }
+    ),
+    "account_list": _freeze(
+        {
+            "items": [
+                {
+                    "id": "acc_sender_12345",
+                    "email": "sender@company.com",
+                    "status": "ACTIVE",
+                    "warmup_status": "COMPLETED",
+                },
+                {
+                    "id": "acc_sender_67890",
+                    "email": "sales@company.com",
+                    "status": "WARMING",
+                    "warmup_status": "IN_PROGRESS",
+                },
+            ],
+            "total": 2,
+        }
+    ),
+    "analytics": _freeze(
+        {
+            "campaign_id": "camp_12345678901234567890",
+            "period": {"start": "2024-01-01", "end": "2024-01-31"},
+            "emails_sent": 500,
+            "emails_opened": 275,
+            "unique_opens": 200,
+            "clicks": 85,
+            "replies": 45,
+            "bounces": 12,
+            "unsubscribes": 3,
+            "open_rate": 55.0,
+            "reply_rate": 9.0,
+            "bounce_rate": 2.4,
+        }
+    ),
+    "job": _freeze(
+        {
+            "id": "job_12345678901234567890",
+            "type": "BULK_LEAD_IMPORT",
+            "status": "COMPLETED",
+            "progress": 100,
+            "total_items": 100,
+            "processed_items": 100,
+            "failed_items": 2,
+            "created_at": "2024-01-20T10:00:00.000Z",
+            "completed_at": "2024-01-20T10:05:00.000Z",
+        }
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def sample_campaign() -> Mapping[str, Any]:
     """Sample campaign record from Instantly API."""
-    return {
-        "id": "camp_12345678901234567890",
-        "name": "Q1 Outreach Campaign",
-        "status": "ACTIVE",
-        "created_at": "2024-01-15T10:30:00.000Z",
-        "account_ids": ["acc_sender_12345"],
-        "leads_count": 150,
-        "emails_sent": 75,
-        "emails_opened": 45,
-        "replies": 12,
-    }
+    return _SAMPLES["campaign"]
 
 
-@pytest.fixture
-def sample_campaign_list() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_campaign_list() -> Mapping[str, Any]:
     """Sample list of campaigns response."""
-    return {
-        "items": [
-            {
-                "id": "camp_12345678901234567890",
-                "name": "Q1 Outreach Campaign",
-                "status": "ACTIVE",
-                "leads_count": 150,
-            },
-            {
-                "id": "camp_22345678901234567891",
-                "name": "Product Launch",
-                "status": "PAUSED",
-                "leads_count": 300,
-            },
-        ],
-        "total": 2,
-        "skip": 0,
-        "limit": 100,
-    }
+    return _SAMPLES["campaign_list"]
 
 
-@pytest.fixture
-def sample_lead() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_lead() -> Mapping[str, Any]:
     """Sample lead record from Instantly API."""
-    return {
-        "email": "john.doe@example.com",
-        "first_name": "John",
-        "last_name": "Doe",
-        "company": "Example Corp",
-        "title": "VP of Engineering",
-        "campaign_id": "camp_12345678901234567890",
-        "status": "CONTACTED",
-        "custom_variables": {"industry": "Technology"},
-        "created_at": "2024-01-16T09:00:00.000Z",
-    }
+    return _SAMPLES["lead"]
 
 
-@pytest.fixture
-def sample_lead_list() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_lead_list() -> Mapping[str, Any]:
     """Sample list of leads response."""
-    return {
-        "items": [
-            {
-                "email": "john.doe@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "status": "CONTACTED",
-            },
-            {
-                "email": "jane.smith@example.com",
-                "first_name": "Jane",
-                "last_name": "Smith",
-                "status": "REPLIED",
-            },
-        ],
-        "total": 2,
-    }
+    return _SAMPLES["lead_list"]
 
 
-@pytest.fixture
-def sample_email_thread() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_email_thread() -> Mapping[str, Any]:
     """Sample email thread from Instantly API."""
-    return {
-        "thread_id": "thread_12345678901234567890",
-        "lead_email": "john.doe@example.com",
-        "campaign_id": "camp_12345678901234567890",
-        "messages": [
-            {
-                "id": "msg_001",
-                "from": "sender@company.com",
-                "to": "john.doe@example.com",
-                "subject": "Introducing our solution",
-                "body": "Hi John, I wanted to reach out...",
-                "sent_at": "2024-01-16T10:00:00.000Z",
-                "type": "outbound",
-            },
-            {
-                "id": "msg_002",
-                "from": "john.doe@example.com",
-                "to": "sender@company.com",
-                "subject": "Re: Introducing our solution",
-                "body": "Thanks for reaching out. I'd love to learn more...",
-                "sent_at": "2024-01-16T14:30:00.000Z",
-                "type": "inbound",
-            },
-        ],
-    }
+    return _SAMPLES["email_thread"]
 
 
-@pytest.fixture
-def sample_account() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_account() -> Mapping[str, Any]:
     """Sample sending account from Instantly API."""
-    return {
-        "id": "acc_sender_12345",
-        "email": "sender@company.com",
-        "name": "Sales Sender Account",
-        "status": "ACTIVE",
-        "warmup_status": "COMPLETED",
-        "daily_limit": 50,
-        "sent_today": 23,
-        "health_score": 95,
-        "created_at": "2024-01-01T00:00:00.000Z",
-    }
+    return _SAMPLES["account"]
 
 
-@pytest.fixture
-def sample_account_list() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_account_list() -> Mapping[str, Any]:
     """Sample list of accounts response."""
-    return {
-        "items": [
-            {
-                "id": "acc_sender_12345",
-                "email": "sender@company.com",
-                "status": "ACTIVE",
-                "warmup_status": "COMPLETED",
-            },
-            {
-                "id": "acc_sender_67890",
-                "email": "sales@company.com",
-                "status": "WARMING",
-                "warmup_status": "IN_PROGRESS",
-            },
-        ],
-        "total": 2,
-    }
+    return _SAMPLES["account_list"]
 
 
-@pytest.fixture
-def sample_analytics() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_analytics() -> Mapping[str, Any]:
     """Sample analytics data from Instantly API."""
-    return {
-        "campaign_id": "camp_12345678901234567890",
-        "period": {"start": "2024-01-01", "end": "2024-01-31"},
-        "emails_sent": 500,
-        "emails_opened": 275,
-        "unique_opens": 200,
-        "clicks": 85,
-        "replies": 45,
-        "bounces": 12,
-        "unsubscribes": 3,
-        "open_rate": 55.0,
-        "reply_rate": 9.0,
-        "bounce_rate": 2.4,
-    }
+    return _SAMPLES["analytics"]
 
 
-@pytest.fixture
-def sample_job() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_job() -> Mapping[str, Any]:
     """Sample background job from Instantly API."""
-    return {
-        "id": "job_12345678901234567890",
-        "type": "BULK_LEAD_IMPORT",
-        "status": "COMPLETED",
-        "progress": 100,
-        "total_items": 100,
-        "processed_items": 100,
-        "failed_items": 2,
-        "created_at": "2024-01-20T10:00:00.000Z",
-        "completed_at": "2024-01-20T10:05:00.000Z",
-    }
+    return _SAMPLES["job"]
 
 
 # =============================================================================
@@ -229,18 +272,57 @@ def sample_job() -> dict[str, Any]:
 # =============================================================================
 
 
-def create_mock_response(status_code: int, json_data: dict) -> MagicMock:
-    """Create a mock httpx response with proper sync json() method."""
-    mock_response = MagicMock()
-    mock_response.status_code = status_code
-    mock_response.json.return_value = json_data
-    mock_response.headers = {}
-    mock_response.text = str(json_data)
-    mock_response.request = MagicMock()
-    mock_response.request.method = "GET"
-    mock_response.request.url = MagicMock()
-    mock_response.request.url.path = "/test"
-    return mock_response
+@lru_cache(maxsize=256)
+def _cached_mock_response(
+    status_code: int, body: str, headers: tuple[tuple[str, str], ...]
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        status_code=status_code,
+        # Decoded per call: client methods return the payload to tests as-is
+        json=lambda: json.loads(body),
+        headers=MappingProxyType(dict(headers)),
+        text=body,
+        request=SimpleNamespace(method="GET", url=SimpleNamespace(path="/test")),
+    )
+
+
+def create_mock_response(
+    status_code: int, json_data: dict, headers: Mapping[str, str] | None = None
+) -> SimpleNamespace:
+    """Create a fake httpx response with proper sync json() method.
+
+    Only the attributes the client reads are provided, so a plain namespace is
+    enough and far cheaper to build than a MagicMock. ``text`` is the serialized
+    body, as httpx would return it, so error-message extraction sees real JSON.
+
+    Responses are cached on their canonical JSON and shared across tests, so
+    they must be treated as read-only; pass ``headers`` instead of setting them.
+    ``json()`` decodes a fresh payload on every call, so results may be mutated.
+    """
+    return _cached_mock_response(
+        status_code,
+        json.dumps(json_data, sort_keys=True),
+        tuple(sorted((headers or {}).items())),
+    )
+
+
+class _RouteMap(dict):
+    """Canned responses for the mocked httpx client, keyed by (method, path)."""
+
+    def set(
+        self,
+        method: str,
+        path: str,
+        json_data: dict,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Register the (shared, read-only) response for a route."""
+        self[(method, path)] = create_mock_response(status_code, json_data, headers)
+
+    async def dispatch(self, method: str, url: str, **kwargs: Any) -> SimpleNamespace:
+        """Stand-in for ``httpx.AsyncClient.request``; ignores any query string."""
+        return self[(method, url.rsplit("?", 1)[0])]
 
 
 def make_instantly_response(data: Any) -> dict[str, Any]:
@@ -274,15 +356,9 @@ def make_instantly_error_response(
 
 
 @pytest.fixture
-def reset_instantly_client(env_api_key) -> Generator[None, None, None]:
+def reset_instantly_client(monkeypatch: pytest.MonkeyPatch, env_api_key) -> None:
     """Reset the global Instantly client between tests."""
     import atlas_gtm_mcp.instantly.client as client_module
 
-    # Save and clear existing client
-    old_client = client_module._instantly_client
-    client_module._instantly_client = None
-
-    yield
-
-    # Restore (or leave as None)
-    client_module._instantly_client = old_client
+    # Clear the existing client; monkeypatch restores it afterwards
+    monkeypatch.setattr(client_module, "_instantly_client", None)
@@ -9,67 +9,69 @@ Tests verify:
 - Job tools (status, list, cancel)
 """
 
-from __future__ import annotations
-
 import os
-from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-if TYPE_CHECKING:
-    pass
+import atlas_gtm_mcp.instantly.client as client_module
+from atlas_gtm_mcp.instantly.client import (
+    InstantlyNonRetriableError,
+    InstantlyRetriableError,
+    get_instantly_client,
+)
 
-from .conftest import create_mock_response
+from .conftest import _RouteMap
 
+# Read-only bulk lead payload shared by the bulk add tests
+_BULK_LEADS = tuple({"email": f"lead{i}@example.com"} for i in range(10))
 
 # =============================================================================
 # Test Setup
 # =============================================================================
 
 
-@pytest.fixture
-def mock_env():
-    """Set up required environment variables for testing."""
-    with patch.dict(
-        os.environ,
-        {
-            "INSTANTLY_API_KEY": "test_api_key_12345",
-        },
-    ):
-        yield
+@pytest.fixture(scope="module")
+def _patched_client_env():
+    """Patch the API key and httpx client once for the whole module."""
+    # Create mock httpx client; route_map installs its request coroutine per test
+    mock_client = MagicMock()
+    mock_client.is_closed = False
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict(os.environ, {"INSTANTLY_API_KEY": "test_api_key_12345"}))
+        stack.enter_context(
+            patch.object(client_module, "INSTANTLY_API_KEY", "test_api_key_12345")
+        )
+        stack.enter_context(
+            patch("atlas_gtm_mcp.instantly.client.httpx.AsyncClient", return_value=mock_client)
+        )
+        yield mock_client
 
 
 @pytest.fixture
-def reset_instantly_module(mock_env):
+def reset_instantly_module(_patched_client_env):
     """Reset Instantly module state and provide mock httpx client."""
-    import atlas_gtm_mcp.instantly.client as client_module
+    mock_client = _patched_client_env
 
     # Reset global state
     client_module._instantly_client = None
+    instantly_client = get_instantly_client()
+    instantly_client._client = mock_client
 
-    # Create mock httpx client
-    mock_client = MagicMock()
-    mock_client.is_closed = False
-    mock_client.request = AsyncMock()
-
-    with patch.object(client_module, "INSTANTLY_API_KEY", "test_api_key_12345"), \
-         patch("atlas_gtm_mcp.instantly.client.httpx.AsyncClient", return_value=mock_client):
-        from atlas_gtm_mcp.instantly.client import get_instantly_client
-
-        instantly_client = get_instantly_client()
-        instantly_client._client = mock_client
-
-        yield mock_client
+    yield mock_client
 
     # Clean up after test
     client_module._instantly_client = None
 
 
-def get_instantly_client():
-    """Get the current Instantly client."""
-    from atlas_gtm_mcp.instantly.client import get_instantly_client as _get_client
-    return _get_client()
+@pytest.fixture
+def route_map(reset_instantly_module) -> _RouteMap:
+    """Route the mocked httpx client's requests through a per-test response table."""
+    routes = _RouteMap()
+    reset_instantly_module.request = routes.dispatch
+    return routes
 
 
 # =============================================================================
@@ -80,19 +82,15 @@ def get_instantly_client():
 class TestListCampaigns:
     """Tests for list_campaigns tool."""
 
-    @pytest.mark.asyncio
-    async def test_list_campaigns_success(self, reset_instantly_module):
+    async def test_list_campaigns_success(self, route_map):
         """Given campaigns exist, return paginated list."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/campaigns", {
             "items": [
                 {"id": "camp_123", "name": "Test Campaign", "status": "ACTIVE"},
                 {"id": "camp_456", "name": "Other Campaign", "status": "PAUSED"},
             ],
             "total": 2,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/campaigns", "test-corr-id", params={"limit": 100, "skip": 0})
@@ -101,16 +99,12 @@ class TestListCampaigns:
         assert "items" in result
         assert len(result["items"]) == 2
 
-    @pytest.mark.asyncio
-    async def test_list_campaigns_with_status_filter(self, reset_instantly_module):
+    async def test_list_campaigns_with_status_filter(self, route_map):
         """Given status filter, return only matching campaigns."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/campaigns", {
             "items": [{"id": "camp_123", "name": "Active Campaign", "status": "ACTIVE"}],
             "total": 1,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get(
@@ -122,13 +116,9 @@ class TestListCampaigns:
         assert len(result["items"]) == 1
         assert result["items"][0]["status"] == "ACTIVE"
 
-    @pytest.mark.asyncio
-    async def test_list_campaigns_empty(self, reset_instantly_module):
+    async def test_list_campaigns_empty(self, route_map):
         """Given no campaigns, return empty list."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {"items": [], "total": 0})
-        mock_httpx.request.return_value = mock_response
+        route_map.set("GET", "/campaigns", {"items": [], "total": 0})
 
         client = get_instantly_client()
         result = await client.get("/campaigns", "test-corr-id", params={"limit": 100, "skip": 0})
@@ -139,18 +129,14 @@ class TestListCampaigns:
 class TestGetCampaign:
     """Tests for get_campaign tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_campaign_success(self, reset_instantly_module):
+    async def test_get_campaign_success(self, route_map):
         """Given valid campaign ID, return campaign details."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/campaigns/camp_123", {
             "id": "camp_123",
             "name": "Test Campaign",
             "status": "ACTIVE",
             "leads_count": 150,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/campaigns/camp_123", "test-corr-id")
@@ -158,15 +144,14 @@ class TestGetCampaign:
         assert result["id"] == "camp_123"
         assert result["name"] == "Test Campaign"
 
-    @pytest.mark.asyncio
-    async def test_get_campaign_not_found(self, reset_instantly_module):
+    async def test_get_campaign_not_found(self, route_map):
         """Given invalid campaign ID, raise error."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(404, {"error": {"message": "Campaign not found"}})
-        mock_httpx.request.return_value = mock_response
-
-        from atlas_gtm_mcp.instantly.client import InstantlyNonRetriableError
+        route_map.set(
+            "GET",
+            "/campaigns/invalid_id",
+            {"error": {"message": "Campaign not found"}},
+            status_code=404,
+        )
 
         client = get_instantly_client()
         with pytest.raises(InstantlyNonRetriableError):
@@ -176,17 +161,13 @@ class TestGetCampaign:
 class TestCreateCampaign:
     """Tests for create_campaign tool."""
 
-    @pytest.mark.asyncio
-    async def test_create_campaign_success(self, reset_instantly_module):
+    async def test_create_campaign_success(self, route_map):
         """Given valid parameters, create campaign."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("POST", "/campaigns", {
             "id": "camp_new_123",
             "name": "New Campaign",
             "status": "DRAFT",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.post(
@@ -202,37 +183,22 @@ class TestCreateCampaign:
 class TestCampaignControls:
     """Tests for launch_campaign and pause_campaign tools."""
 
-    @pytest.mark.asyncio
-    async def test_launch_campaign_success(self, reset_instantly_module):
-        """Given draft campaign, launch it."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
-            "id": "camp_123",
-            "status": "ACTIVE",
-        })
-        mock_httpx.request.return_value = mock_response
-
-        client = get_instantly_client()
-        result = await client.post("/campaigns/camp_123/launch", "test-corr-id")
-
-        assert result["status"] == "ACTIVE"
-
-    @pytest.mark.asyncio
-    async def test_pause_campaign_success(self, reset_instantly_module):
-        """Given active campaign, pause it."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
-            "id": "camp_123",
-            "status": "PAUSED",
-        })
-        mock_httpx.request.return_value = mock_response
+    @pytest.mark.parametrize(
+        "action,status",
+        [
+            pytest.param("launch", "ACTIVE", id="launch"),
+            pytest.param("pause", "PAUSED", id="pause"),
+        ],
+    )
+    async def test_campaign_control_success(self, route_map, action, status):
+        """Given a campaign, launching or pausing it returns the new status."""
+        path = f"/campaigns/camp_123/{action}"
+        route_map.set("POST", path, {"id": "camp_123", "status": status})
 
         client = get_instantly_client()
-        result = await client.post("/campaigns/camp_123/pause", "test-corr-id")
+        result = await client.post(path, "test-corr-id")
 
-        assert result["status"] == "PAUSED"
+        assert result["status"] == status
 
 
 # =============================================================================
@@ -243,19 +209,15 @@ class TestCampaignControls:
 class TestListLeads:
     """Tests for list_leads tool."""
 
-    @pytest.mark.asyncio
-    async def test_list_leads_success(self, reset_instantly_module):
+    async def test_list_leads_success(self, route_map):
         """Given leads exist, return paginated list."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/leads", {
             "items": [
                 {"email": "john@example.com", "status": "CONTACTED"},
                 {"email": "jane@example.com", "status": "REPLIED"},
             ],
             "total": 2,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get(
@@ -270,18 +232,14 @@ class TestListLeads:
 class TestGetLead:
     """Tests for get_lead tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_lead_by_email(self, reset_instantly_module):
+    async def test_get_lead_by_email(self, route_map):
         """Given valid email, return lead details."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/leads/john@example.com", {
             "email": "john@example.com",
             "first_name": "John",
             "last_name": "Doe",
             "status": "CONTACTED",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get(
@@ -296,17 +254,13 @@ class TestGetLead:
 class TestAddLead:
     """Tests for add_lead tool."""
 
-    @pytest.mark.asyncio
-    async def test_add_lead_success(self, reset_instantly_module):
+    async def test_add_lead_success(self, route_map):
         """Given valid lead data, add to campaign."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("POST", "/leads", {
             "email": "newlead@example.com",
             "status": "NEW",
             "campaign_id": "camp_123",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.post(
@@ -326,17 +280,13 @@ class TestAddLead:
 class TestAddLeadsBulk:
     """Tests for add_leads_bulk tool."""
 
-    @pytest.mark.asyncio
-    async def test_add_leads_bulk_success(self, reset_instantly_module):
+    async def test_add_leads_bulk_success(self, route_map):
         """Given valid bulk lead data, add all to campaign."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("POST", "/leads/bulk", {
             "success": 10,
             "failed": 0,
             "total": 10,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.post(
@@ -344,7 +294,7 @@ class TestAddLeadsBulk:
             "test-corr-id",
             json={
                 "campaign_id": "camp_123",
-                "leads": [{"email": f"lead{i}@example.com"} for i in range(10)],
+                "leads": list(_BULK_LEADS),
             }
         )
 
@@ -355,16 +305,12 @@ class TestAddLeadsBulk:
 class TestLeadStatusOperations:
     """Tests for lead status tools."""
 
-    @pytest.mark.asyncio
-    async def test_update_lead_status_success(self, reset_instantly_module):
+    async def test_update_lead_status_success(self, route_map):
         """Given valid lead, update status."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("PATCH", "/leads/john@example.com/status", {
             "email": "john@example.com",
             "status": "INTERESTED",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.patch(
@@ -375,13 +321,9 @@ class TestLeadStatusOperations:
 
         assert result["status"] == "INTERESTED"
 
-    @pytest.mark.asyncio
-    async def test_pause_lead_success(self, reset_instantly_module):
+    async def test_pause_lead_success(self, route_map):
         """Given active lead, pause sequence."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {"paused": True})
-        mock_httpx.request.return_value = mock_response
+        route_map.set("POST", "/leads/john@example.com/pause", {"paused": True})
 
         client = get_instantly_client()
         result = await client.post(
@@ -401,12 +343,9 @@ class TestLeadStatusOperations:
 class TestGetEmailThread:
     """Tests for get_email_thread tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_email_thread_success(self, reset_instantly_module):
+    async def test_get_email_thread_success(self, route_map):
         """Given valid thread ID, return conversation."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/threads/thread_123", {
             "thread_id": "thread_123",
             "lead_email": "john@example.com",
             "messages": [
@@ -414,7 +353,6 @@ class TestGetEmailThread:
                 {"id": "msg_2", "type": "inbound", "body": "Hi there"},
             ],
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/threads/thread_123", "test-corr-id")
@@ -425,17 +363,13 @@ class TestGetEmailThread:
 class TestSendReply:
     """Tests for send_reply tool."""
 
-    @pytest.mark.asyncio
-    async def test_send_reply_success(self, reset_instantly_module):
+    async def test_send_reply_success(self, route_map):
         """Given valid thread, send reply."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("POST", "/threads/thread_123/reply", {
             "id": "msg_new",
             "thread_id": "thread_123",
             "status": "QUEUED",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.post(
@@ -455,18 +389,14 @@ class TestSendReply:
 class TestListAccounts:
     """Tests for list_accounts tool."""
 
-    @pytest.mark.asyncio
-    async def test_list_accounts_success(self, reset_instantly_module):
+    async def test_list_accounts_success(self, route_map):
         """Given accounts exist, return list."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/accounts", {
             "items": [
                 {"id": "acc_123", "email": "sender@company.com", "status": "ACTIVE"},
                 {"id": "acc_456", "email": "sales@company.com", "status": "WARMING"},
             ],
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/accounts", "test-corr-id")
@@ -477,12 +407,9 @@ class TestListAccounts:
 class TestGetAccountStatus:
     """Tests for get_account_status tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_account_status_success(self, reset_instantly_module):
+    async def test_get_account_status_success(self, route_map):
         """Given valid account, return status details."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/accounts/acc_123/status", {
             "id": "acc_123",
             "status": "ACTIVE",
             "warmup_status": "COMPLETED",
@@ -490,7 +417,6 @@ class TestGetAccountStatus:
             "sent_today": 23,
             "health_score": 95,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/accounts/acc_123/status", "test-corr-id")
@@ -506,12 +432,9 @@ class TestGetAccountStatus:
 class TestGetCampaignAnalytics:
     """Tests for get_campaign_analytics tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_campaign_analytics_success(self, reset_instantly_module):
+    async def test_get_campaign_analytics_success(self, route_map):
         """Given valid campaign, return analytics."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/campaigns/camp_123/analytics", {
             "campaign_id": "camp_123",
             "emails_sent": 500,
             "emails_opened": 275,
@@ -519,7 +442,6 @@ class TestGetCampaignAnalytics:
             "open_rate": 55.0,
             "reply_rate": 9.0,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/campaigns/camp_123/analytics", "test-corr-id")
@@ -531,18 +453,14 @@ class TestGetCampaignAnalytics:
 class TestGetDailyStats:
     """Tests for get_daily_stats tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_daily_stats_success(self, reset_instantly_module):
+    async def test_get_daily_stats_success(self, route_map):
         """Given date range, return daily breakdown."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/analytics/daily", {
             "stats": [
                 {"date": "2024-01-15", "sent": 50, "opened": 25, "replied": 5},
                 {"date": "2024-01-16", "sent": 48, "opened": 30, "replied": 8},
             ],
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get(
@@ -562,12 +480,9 @@ class TestGetDailyStats:
 class TestGetJobStatus:
     """Tests for get_job_status tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_job_status_success(self, reset_instantly_module):
+    async def test_get_job_status_success(self, route_map):
         """Given valid job ID, return status."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("GET", "/jobs/job_123", {
             "id": "job_123",
             "type": "BULK_LEAD_IMPORT",
             "status": "COMPLETED",
@@ -575,7 +490,6 @@ class TestGetJobStatus:
             "total_items": 100,
             "processed_items": 100,
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.get("/jobs/job_123", "test-corr-id")
@@ -587,16 +501,12 @@ class TestGetJobStatus:
 class TestCancelJob:
     """Tests for cancel_job tool."""
 
-    @pytest.mark.asyncio
-    async def test_cancel_job_success(self, reset_instantly_module):
+    async def test_cancel_job_success(self, route_map):
         """Given pending job, cancel it."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(200, {
+        route_map.set("POST", "/jobs/job_123/cancel", {
             "id": "job_123",
             "status": "CANCELLED",
         })
-        mock_httpx.request.return_value = mock_response
 
         client = get_instantly_client()
         result = await client.post("/jobs/job_123/cancel", "test-corr-id")
@@ -612,44 +522,41 @@ class TestCancelJob:
 class TestErrorHandling:
     """Tests for error handling across tools."""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_error_is_retriable(self, reset_instantly_module):
+    async def test_rate_limit_error_is_retriable(self, route_map):
         """Given 429 response, raise retriable error."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(429, {"error": {"message": "Rate limit exceeded"}})
-        mock_response.headers = {"Retry-After": "60"}
-        mock_httpx.request.return_value = mock_response
-
-        from atlas_gtm_mcp.instantly.client import InstantlyRetriableError
+        route_map.set(
+            "GET",
+            "/campaigns",
+            {"error": {"message": "Rate limit exceeded"}},
+            status_code=429,
+            headers={"Retry-After": "60"},
+        )
 
         client = get_instantly_client()
         with pytest.raises(InstantlyRetriableError):
             await client.get("/campaigns", "test-corr-id")
 
-    @pytest.mark.asyncio
-    async def test_auth_error_is_non_retriable(self, reset_instantly_module):
+    async def test_auth_error_is_non_retriable(self, route_map):
         """Given 401 response, raise non-retriable error."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(401, {"error": {"message": "Invalid API key"}})
-        mock_httpx.request.return_value = mock_response
-
-        from atlas_gtm_mcp.instantly.client import InstantlyNonRetriableError
+        route_map.set(
+            "GET",
+            "/campaigns",
+            {"error": {"message": "Invalid API key"}},
+            status_code=401,
+        )
 
         client = get_instantly_client()
         with pytest.raises(InstantlyNonRetriableError):
             await client.get("/campaigns", "test-corr-id")
 
-    @pytest.mark.asyncio
-    async def test_server_error_is_retriable(self, reset_instantly_module):
+    async def test_server_error_is_retriable(self, route_map):
         """Given 5xx response, raise retriable error."""
-        mock_httpx = reset_instantly_module
-
-        mock_response = create_mock_response(500, {"error": {"message": "Internal error"}})
-        mock_httpx.request.return_value = mock_response
-
-        from atlas_gtm_mcp.instantly.client import InstantlyRetriableError
+        route_map.set(
+            "GET",
+            "/campaigns",
+            {"error": {"message": "Internal error"}},
+            status_code=500,
+        )
 
         client = get_instantly_client()
         with pytest.raises(InstantlyRetriableError):
@@ -7,10 +7,13 @@ Provides:
 """
 
 import hashlib
-import random
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 
+import numpy as np
 import pytest
 from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
 
@@ -20,10 +23,24 @@ from tests.conftest import TEST_BRAIN_ID, TEST_VERTICAL
 def string_to_uuid(s: str) -> str:
     """Convert a string to a deterministic UUID.
 
-    Uses MD5 hash of string to generate consistent UUID for same input.
-    This is required because Qdrant point IDs must be UUIDs or integers.
+    Uses a 16-byte BLAKE2b digest of the string to generate a consistent UUID
+    for the same input. This is required because Qdrant point IDs must be
+    UUIDs or integers.
     """
-    return str(uuid.UUID(hashlib.md5(s.encode()).hexdigest()))
+    return str(uuid.UUID(bytes=hashlib.blake2b(s.encode(), digest_size=16).digest()))
+
+
+def pytest_collection_modifyitems(items):
+    """Keep integration tests on one xdist worker.
+
+    They share the live Qdrant collections and session-scoped seed data, so
+    running them in parallel workers would race on seeding and cleanup.
+    """
+    here = Path(__file__).parent
+    for item in items:
+        if here in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group("qdrant_integration"))
+
 
 # Embedding dimension (must match Voyage AI voyage-3.5-lite)
 EMBEDDING_DIM = 1024
@@ -34,15 +51,48 @@ EMBEDDING_DIM = 1024
 # =============================================================================
 
 
+@lru_cache(maxsize=4096)
+def _cached_embedding(text: str, dim: int) -> tuple[float, ...]:
+    # Drawn in float32, the precision Qdrant stores vectors at, then mapped to [-1, 1)
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+    vector = np.random.default_rng(seed).random(dim, dtype=np.float32) * 2 - 1
+    return tuple(vector.tolist())
+
+
 def deterministic_embedding(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
     """Generate deterministic embedding from text for reproducible tests.
 
-    Uses MD5 hash as seed for random number generator to produce
-    consistent vectors for the same input text.
+    Uses a BLAKE2b hash as seed for random number generator to produce
+    consistent vectors for the same input text. Vectors are cached for the
+    session; each call gets its own list copy.
     """
-    seed = int(hashlib.md5(text.encode()).hexdigest()[:8], 16)
-    rng = random.Random(seed)
-    return [rng.uniform(-1, 1) for _ in range(dim)]
+    return list(_cached_embedding(text, dim))
+
+
+def _mock_embed_query(text: str) -> list[float]:
+    return deterministic_embedding(text)
+
+
+def _mock_embed_document(text: str) -> list[float]:
+    return deterministic_embedding(text)
+
+
+def _mock_embed_batch(texts: list[str], input_type: str = "document") -> list[list[float]]:
+    return [deterministic_embedding(text) for text in texts]
+
+
+# Every place the embedding functions are bound: the embeddings module itself,
+# the qdrant package __init__ where the tools use them, and quality_gates.
+_EMBEDDING_PATCHES = (
+    ("atlas_gtm_mcp.qdrant.embeddings.embed_query", _mock_embed_query),
+    ("atlas_gtm_mcp.qdrant.embeddings.embed_document", _mock_embed_document),
+    ("atlas_gtm_mcp.qdrant.embeddings.embed_batch", _mock_embed_batch),
+    ("atlas_gtm_mcp.qdrant.embed_query", _mock_embed_query),
+    ("atlas_gtm_mcp.qdrant.embed_document", _mock_embed_document),
+    ("atlas_gtm_mcp.qdrant.embed_batch", _mock_embed_batch),
+    ("atlas_gtm_mcp.qdrant.quality_gates.embed_query", _mock_embed_query),
+    ("atlas_gtm_mcp.qdrant.quality_gates.embed_batch", _mock_embed_batch),
+)
 
 
 @pytest.fixture(autouse=True)
@@ -56,47 +106,8 @@ def mock_voyage_embeddings(monkeypatch):
 
     Embeddings are deterministic based on input text hash.
     """
-
-    def mock_embed_query(text: str) -> list[float]:
-        return deterministic_embedding(text)
-
-    def mock_embed_document(text: str) -> list[float]:
-        return deterministic_embedding(text)
-
-    def mock_embed_batch(texts: list[str], input_type: str = "document") -> list[list[float]]:
-        return [deterministic_embedding(text) for text in texts]
-
-    # Mock at module level where functions are imported
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embeddings.embed_query",
-        mock_embed_query,
-    )
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embeddings.embed_document",
-        mock_embed_document,
-    )
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embeddings.embed_batch",
-        mock_embed_batch,
-    )
-    # Also mock at the __init__ level where they're used
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embed_query",
-        mock_embed_query,
-    )
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embed_document",
-        mock_embed_document,
-    )
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.embed_batch",
-        mock_embed_batch,
-    )
-    # Also mock at quality_gates module level
-    monkeypatch.setattr(
-        "atlas_gtm_mcp.qdrant.quality_gates.embed_query",
-        mock_embed_query,
-    )
+    for target, mock in _EMBEDDING_PATCHES:
+        monkeypatch.setattr(target, mock)
 
 
 # =============================================================================
@@ -104,51 +115,53 @@ def mock_voyage_embeddings(monkeypatch):
 # =============================================================================
 
 
-@pytest.fixture(scope="session")
-def seed_test_brain(qdrant_client):
-    """Seed test brain configuration.
+def _upload_seed_records(client, collection_name: str, records: list[dict], embed_text):
+    """Upload seed records, keyed by a UUID derived from their string ID.
 
-    Creates a dedicated test brain that all integration tests use.
-    Cleaned up after the test session.
+    Goes through upload_collection with parallel ids/vectors/payloads, so no
+    PointStruct objects are built for the seed data.
     """
-    brain_point = PointStruct(
-        id=string_to_uuid(TEST_BRAIN_ID),  # Use UUID for Qdrant point ID
-        vector=deterministic_embedding(f"brain {TEST_VERTICAL}"),
-        payload={
-            "id": TEST_BRAIN_ID,  # Keep string ID in payload for lookups
-            "name": "Test Brain",
-            "vertical": TEST_VERTICAL,
-            "version": "1.0",
-            "status": "active",
-            "description": "Brain for integration testing",
-            "config": {
-                "default_tier_thresholds": {"high": 70, "low": 50},
-                "auto_response_enabled": True,
-                "learning_enabled": True,
-                "quality_gate_threshold": 0.7,
-            },
-            "stats": {
-                "icp_rules_count": 0,
-                "templates_count": 0,
-                "handlers_count": 0,
-                "research_docs_count": 0,
-                "insights_count": 0,
-            },
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        },
+    client.upload_collection(
+        collection_name=collection_name,
+        ids=[string_to_uuid(record["id"]) for record in records],  # UUIDs for Qdrant
+        vectors=[deterministic_embedding(embed_text(record)) for record in records],
+        payload=records,  # Keep string ID in payload
+        wait=True,
     )
 
-    qdrant_client.upsert(collection_name="brains", points=[brain_point])
-    yield TEST_BRAIN_ID
 
-    # Cleanup after all tests
-    _cleanup_test_data(qdrant_client)
+@pytest.fixture(scope="session")
+def seed_all_test_data(qdrant_client):
+    """Seed the test brain and all of its content in one pass.
 
+    Every record is built up front and each collection gets a single upload.
+    The per-collection seed fixtures below read their records from the
+    returned mapping. Cleaned up after the test session.
+    """
+    brain = {
+        "id": TEST_BRAIN_ID,  # Keep string ID in payload for lookups
+        "name": "Test Brain",
+        "vertical": TEST_VERTICAL,
+        "version": "1.0",
+        "status": "active",
+        "description": "Brain for integration testing",
+        "config": {
+            "default_tier_thresholds": {"high": 70, "low": 50},
+            "auto_response_enabled": True,
+            "learning_enabled": True,
+            "quality_gate_threshold": 0.7,
+        },
+        "stats": {
+            "icp_rules_count": 0,
+            "templates_count": 0,
+            "handlers_count": 0,
+            "research_docs_count": 0,
+            "insights_count": 0,
+        },
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
 
-@pytest.fixture(scope="session")
-def seed_icp_rules(qdrant_client, seed_test_brain):
-    """Seed ICP rules for testing."""
     rules = [
         {
             "id": "rule_test_firmographic_001",
@@ -185,24 +198,6 @@ def seed_icp_rules(qdrant_client, seed_test_brain):
         },
     ]
 
-    points = [
-        PointStruct(
-            id=string_to_uuid(rule["id"]),  # Use UUID for Qdrant point ID
-            vector=deterministic_embedding(
-                f"{rule['category']} {rule['attribute']} {rule['reasoning']}"
-            ),
-            payload=rule,  # Keep string ID in payload
-        )
-        for rule in rules
-    ]
-
-    qdrant_client.upsert(collection_name="icp_rules", points=points)
-    yield rules
-
-
-@pytest.fixture(scope="session")
-def seed_response_templates(qdrant_client, seed_test_brain):
-    """Seed response templates for testing."""
     templates = [
         {
             "id": "template_test_positive_t1",
@@ -233,22 +228,6 @@ def seed_response_templates(qdrant_client, seed_test_brain):
         },
     ]
 
-    points = [
-        PointStruct(
-            id=string_to_uuid(tpl["id"]),  # Use UUID for Qdrant point ID
-            vector=deterministic_embedding(f"{tpl['reply_type']} {tpl['template_text']}"),
-            payload=tpl,  # Keep string ID in payload
-        )
-        for tpl in templates
-    ]
-
-    qdrant_client.upsert(collection_name="response_templates", points=points)
-    yield templates
-
-
-@pytest.fixture(scope="session")
-def seed_objection_handlers(qdrant_client, seed_test_brain):
-    """Seed objection handlers for testing."""
     handlers = [
         {
             "id": "handler_test_pricing_001",
@@ -270,24 +249,6 @@ def seed_objection_handlers(qdrant_client, seed_test_brain):
         },
     ]
 
-    points = [
-        PointStruct(
-            id=string_to_uuid(h["id"]),  # Use UUID for Qdrant point ID
-            vector=deterministic_embedding(
-                f"{h['objection_type']} {h['handler_response']}"
-            ),
-            payload=h,  # Keep string ID in payload
-        )
-        for h in handlers
-    ]
-
-    qdrant_client.upsert(collection_name="objection_handlers", points=points)
-    yield handlers
-
-
-@pytest.fixture(scope="session")
-def seed_market_research(qdrant_client, seed_test_brain):
-    """Seed market research documents for testing."""
     research = [
         {
             "id": "research_test_overview_001",
@@ -309,19 +270,64 @@ def seed_market_research(qdrant_client, seed_test_brain):
         },
     ]
 
-    points = [
-        PointStruct(
-            id=string_to_uuid(r["id"]),  # Use UUID for Qdrant point ID
-            vector=deterministic_embedding(
-                f"{r['content_type']} {r['title']} {r['content']}"
-            ),
-            payload=r,  # Keep string ID in payload
-        )
-        for r in research
-    ]
+    seeds = (
+        ("brains", [brain], lambda b: f"brain {b['vertical']}"),
+        ("icp_rules", rules, lambda r: f"{r['category']} {r['attribute']} {r['reasoning']}"),
+        ("response_templates", templates, lambda t: f"{t['reply_type']} {t['template_text']}"),
+        (
+            "objection_handlers",
+            handlers,
+            lambda h: f"{h['objection_type']} {h['handler_response']}",
+        ),
+        ("market_research", research, lambda r: f"{r['content_type']} {r['title']} {r['content']}"),
+    )
+    for collection_name, records, embed_text in seeds:
+        _upload_seed_records(qdrant_client, collection_name, records, embed_text)
+
+    yield {
+        "brain_id": TEST_BRAIN_ID,
+        "icp_rules": rules,
+        "response_templates": templates,
+        "objection_handlers": handlers,
+        "market_research": research,
+    }
+
+    # Cleanup after all tests
+    _cleanup_test_data(qdrant_client)
+
+
+@pytest.fixture(scope="session")
+def seed_test_brain(seed_all_test_data):
+    """Seed test brain configuration.
+
+    Creates a dedicated test brain that all integration tests use.
+    Cleaned up after the test session.
+    """
+    return seed_all_test_data["brain_id"]
 
-    qdrant_client.upsert(collection_name="market_research", points=points)
-    yield research
+
+@pytest.fixture(scope="session")
+def seed_icp_rules(seed_all_test_data):
+    """Seed ICP rules for testing."""
+    return seed_all_test_data["icp_rules"]
+
+
+@pytest.fixture(scope="session")
+def seed_response_templates(seed_all_test_data):
+    """Seed response templates for testing."""
+    return seed_all_test_data["response_templates"]
+
+
+@pytest.fixture(scope="session")
+def seed_objection_handlers(seed_all_test_data):
+    """Seed objection handlers for testing."""
+    return seed_all_test_data["objection_handlers"]
+
+
+@pytest.fixture(scope="session")
+def seed_market_research(seed_all_test_data):
+    """Seed market research documents for testing."""
+    return seed_all_test_data["market_research"]
 
 
 @pytest.fixture
@@ -356,30 +362,37 @@ def _delete_test_insights(client):
         pass  # Collection might be empty or not exist
 
 
-def _cleanup_test_data(client):
-    """Clean up all test data after test session."""
-    collections = [
-        "icp_rules",
-        "response_templates",
-        "objection_handlers",
-        "market_research",
-        "insights",
-    ]
+# Collections whose points are scoped to a brain by their payload brain_id
+_BRAIN_CONTENT_COLLECTIONS = (
+    "icp_rules",
+    "response_templates",
+    "objection_handlers",
+    "market_research",
+    "insights",
+)
 
-    for collection in collections:
+
+def _delete_brain_content(client, brain_id: str):
+    """Delete a brain's points from every content collection.
+
+    The collections are independent, so the deletes run concurrently to
+    overlap their round-trips. The brain point itself is left to the caller.
+    """
+    selector = Filter(must=[FieldCondition(key="brain_id", match=MatchValue(value=brain_id))])
+
+    def _delete(collection: str) -> None:
         try:
-            client.delete(
-                collection_name=collection,
-                points_selector=Filter(
-                    must=[
-                        FieldCondition(
-                            key="brain_id", match=MatchValue(value=TEST_BRAIN_ID)
-                        )
-                    ]
-                ),
-            )
+            client.delete(collection_name=collection, points_selector=selector)
         except Exception:
-            pass
+            pass  # Collection might be empty or not exist
+
+    with ThreadPoolExecutor(max_workers=len(_BRAIN_CONTENT_COLLECTIONS)) as pool:
+        list(pool.map(_delete, _BRAIN_CONTENT_COLLECTIONS))
+
+
+def _cleanup_test_data(client):
+    """Clean up all test data after test session."""
+    _delete_brain_content(client, TEST_BRAIN_ID)
 
     # Delete the brain itself
     try:
@@ -588,25 +601,8 @@ def clean_lifecycle_data(qdrant_client, lifecycle_brain_id, lifecycle_vertical):
 
 def _cleanup_brain_lifecycle_data(client, brain_id: str, vertical: str):
     """Clean up all data associated with a lifecycle test brain."""
-    collections = [
-        "icp_rules",
-        "response_templates",
-        "objection_handlers",
-        "market_research",
-        "insights",
-    ]
-
     # Delete content scoped to brain_id
-    for collection in collections:
-        try:
-            client.delete(
-                collection_name=collection,
-                points_selector=Filter(
-                    must=[FieldCondition(key="brain_id", match=MatchValue(value=brain_id))]
-                ),
-            )
-        except Exception:
-            pass
+    _delete_brain_content(client, brain_id)
 
     # Delete the brain by both ID and vertical (to catch any orphaned brains)
     try:
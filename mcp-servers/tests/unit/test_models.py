@@ -7,9 +7,17 @@ import pytest
 from pydantic import ValidationError
 
 from atlas_gtm_mcp.qdrant.models import (
+    BRAIN_STATUS_BY_VALUE,
+    CONTENT_TYPE_BY_VALUE,
+    ICP_CATEGORY_BY_VALUE,
+    IMPORTANCE_BY_VALUE,
+    INSIGHT_CATEGORY_BY_VALUE,
+    REPLY_TYPE_BY_VALUE,
     AddInsightInput,
     BrainId,
+    BrainReportResult,
     BrainResult,
+    BrainStatsResult,
     BrainStatus,
     ContentType,
     FindObjectionHandlerInput,
@@ -25,7 +33,13 @@ from atlas_gtm_mcp.qdrant.models import (
     SearchMarketResearchInput,
     SourceMetadata,
     ValidationStatus,
+    calculate_completeness,
+    calculate_completeness_from_counts,
+    generate_brain_id,
+    generate_point_id,
+    generate_point_id_fast,
     validate_brain_id,
+    validate_status_transition,
 )
 
 
@@ -146,6 +160,22 @@ class TestEnums:
         for value in expected:
             assert ContentType(value) is not None
 
+    @pytest.mark.parametrize(
+        ("lookup", "enum_cls"),
+        [
+            (ICP_CATEGORY_BY_VALUE, ICPCategory),
+            (REPLY_TYPE_BY_VALUE, ReplyType),
+            (INSIGHT_CATEGORY_BY_VALUE, InsightCategory),
+            (IMPORTANCE_BY_VALUE, Importance),
+            (BRAIN_STATUS_BY_VALUE, BrainStatus),
+            (CONTENT_TYPE_BY_VALUE, ContentType),
+        ],
+    )
+    def test_value_lookups_match_enum(self, lookup, enum_cls):
+        """Test value lookups resolve every member and nothing else."""
+        assert lookup == {member.value: enum_cls(member.value) for member in enum_cls}
+        assert lookup.get("not_a_member") is None
+
 
 class TestQueryICPRulesInput:
     """Tests for QueryICPRulesInput model."""
@@ -398,3 +428,153 @@ class TestSearchMarketResearchInput:
                     query="test",
                     limit=limit,
                 )
+
+
+class TestResultModels:
+    """Tests for tool output models."""
+
+    def _icp_rule_result(self) -> ICPRuleResult:
+        return ICPRuleResult(
+            id="rule_1",
+            score=0.9,
+            category=ICPCategory.FIRMOGRAPHIC,
+            attribute="company_size",
+            display_name="Company Size",
+            condition={"operator": "gte", "value": 50},
+            score_weight=20,
+            reasoning="Larger companies have budget",
+        )
+
+    def test_results_are_frozen(self):
+        """Test output models cannot be mutated after construction."""
+        result = self._icp_rule_result()
+        with pytest.raises(ValidationError):
+            result.score = 0.1
+
+    def test_timestamps_parse_to_datetime(self):
+        """Test ISO timestamps from Qdrant payloads become datetimes and round-trip."""
+        report = BrainReportResult(
+            brain_id="brain_iro_v1",
+            name="IRO",
+            vertical="iro",
+            status=BrainStatus.ACTIVE,
+            completeness=0.5,
+            content_details=[
+                {"collection": "icp_rules", "count": 3, "last_updated": "2025-01-02T03:04:05Z"},
+                {"collection": "market_research", "count": 0, "last_updated": None},
+            ],
+            created_at="2025-01-01T00:00:00Z",
+            updated_at="2025-01-02T03:04:05Z",
+            message="ok",
+        )
+        assert report.created_at < report.updated_at
+        assert report.content_details[0].last_updated == report.updated_at
+
+        dumped = report.model_dump(mode="json")
+        assert dumped["created_at"] == "2025-01-01T00:00:00Z"
+        assert dumped["content_details"][1]["last_updated"] is None
+
+    def test_results_forbid_extra_fields(self):
+        """Test output models reject unknown fields."""
+        with pytest.raises(ValidationError) as exc_info:
+            ICPRuleResult(**self._icp_rule_result().model_dump(), unexpected="x")
+        assert "unexpected" in str(exc_info.value)
+
+
+class TestValidateStatusTransition:
+    """Tests for brain status transitions."""
+
+    @pytest.mark.parametrize(
+        ("current", "new", "expected"),
+        [
+            (BrainStatus.DRAFT, BrainStatus.ACTIVE, True),
+            (BrainStatus.ACTIVE, BrainStatus.ARCHIVED, True),
+            (BrainStatus.ARCHIVED, BrainStatus.ACTIVE, True),
+            (BrainStatus.DRAFT, BrainStatus.ARCHIVED, False),
+            (BrainStatus.ACTIVE, BrainStatus.DRAFT, False),
+            (BrainStatus.ARCHIVED, BrainStatus.DRAFT, False),
+            (BrainStatus.ACTIVE, BrainStatus.ACTIVE, False),
+        ],
+    )
+    def test_transitions(self, current, new, expected):
+        """Test only draft->active, active->archived, archived->active are valid."""
+        assert validate_status_transition(current, new) is expected
+
+
+class TestCalculateCompleteness:
+    """Tests for brain content completeness."""
+
+    @pytest.mark.parametrize(
+        ("counts", "expected"),
+        [
+            ((0, 0, 0, 0), 0.0),
+            ((3, 0, 0, 0), 0.25),
+            ((0, 1, 0, 7), 0.5),
+            ((1, 1, 1, 0), 0.75),
+            ((5, 2, 9, 1), 1.0),
+        ],
+    )
+    def test_counts_content_types_present(self, counts, expected):
+        """Test completeness is the share of the four content types present."""
+        icp_rules, templates, handlers, research_docs = counts
+        stats = BrainStatsResult(
+            brain_id="brain_iro_v1",
+            icp_rules_count=icp_rules,
+            templates_count=templates,
+            handlers_count=handlers,
+            research_docs_count=research_docs,
+            insights_count=42,
+        )
+        assert calculate_completeness(stats) == expected
+        assert calculate_completeness_from_counts(*counts) == expected
+
+
+class TestGenerateBrainId:
+    """Tests for brain ID generation."""
+
+    def test_format(self):
+        """Test generated IDs embed a millisecond timestamp and validate."""
+        brain_id = generate_brain_id("defense")
+        assert validate_brain_id(brain_id)
+        timestamp = int(brain_id.removeprefix("brain_defense_"))
+        assert len(str(timestamp)) == 13
+
+
+class TestGeneratePointId:
+    """Tests for deterministic point ID generation."""
+
+    def test_is_deterministic_uuid(self):
+        """Test the same brain_id/key pair always maps to the same UUID."""
+        point_id = generate_point_id("brain_iro_v1", "Company Size")
+        assert point_id == generate_point_id("brain_iro_v1", "Company Size")
+        assert [len(part) for part in point_id.split("-")] == [8, 4, 4, 4, 12]
+
+    def test_is_stable_across_releases(self):
+        """Test IDs of already-seeded points do not change."""
+        assert generate_point_id("brain_a_1", "x") == "4ea916d3-b665-ea3a-c36e-d5afd306158c"
+
+    def test_fast_path_matches(self):
+        """Test the pre-encoded variant returns the same ID."""
+        assert generate_point_id_fast(b"brain_iro_v1", "Company Size") == generate_point_id(
+            "brain_iro_v1", "Company Size"
+        )
+
+    def test_is_scoped_by_brain(self):
+        """Test the same key in different brains yields different IDs."""
+        assert generate_point_id("brain_iro_v1", "rule") != generate_point_id(
+            "brain_iro_v2", "rule"
+        )
+
+    def test_blake2b_digest(self, monkeypatch):
+        """Test the opt-in BLAKE2b digest keeps the UUID format."""
+        from atlas_gtm_mcp.qdrant import models
+
+        monkeypatch.setattr(models, "POINT_ID_HASH", "blake2b")
+        generate_point_id.cache_clear()
+        try:
+            point_id = generate_point_id("brain_a_1", "x")
+        finally:
+            generate_point_id.cache_clear()
+
+        assert point_id != "4ea916d3-b665-ea3a-c36e-d5afd306158c"
+        assert [len(part) for part in point_id.split("-")] == [8, 4, 4, 4, 12]
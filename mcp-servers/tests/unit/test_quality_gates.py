@@ -3,8 +3,14 @@
 Tests for T2: All quality gate logic tested.
 """
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
 import pytest
 
+from atlas_gtm_mcp.qdrant import quality_gates
 from atlas_gtm_mcp.qdrant.models import (
     Importance,
     InsightCategory,
@@ -14,8 +20,20 @@ from atlas_gtm_mcp.qdrant.models import (
 from atlas_gtm_mcp.qdrant.quality_gates import (
     DUPLICATE_SIMILARITY_THRESHOLD,
     MIN_CONFIDENCE_THRESHOLD,
+    NUMBA_AVAILABLE,
+    QualityGateItem,
+    _max_dot,
+    _max_dot_numpy,
+    _normalize,
+    _SemanticCache,
     calculate_confidence,
+    calculate_confidence_batch,
+    check_duplicate,
+    forget_brain,
+    remember_insight,
+    run_quality_gate_batch,
     should_require_validation,
+    should_require_validation_batch,
 )
 
 
@@ -189,6 +207,25 @@ class TestShouldRequireValidation:
         )
         assert result is True
 
+    def test_batch_matches_single(self):
+        """Test the vectorized variant agrees with the scalar one."""
+        cases = [
+            (importance, category, confidence)
+            for importance in Importance
+            for category in InsightCategory
+            for confidence in (0.79, 0.80, 0.95)
+        ]
+        importances, categories, confidences = zip(*cases, strict=True)
+
+        result = should_require_validation_batch(importances, categories, confidences)
+
+        assert result.tolist() == [should_require_validation(*case) for case in cases]
+
+    def test_batch_rejects_unknown_values(self):
+        """Test the vectorized variant validates like the scalar one."""
+        with pytest.raises(ValueError):
+            should_require_validation_batch(["urgent"], ["pain_point"], [0.9])
+
 
 class TestThresholds:
     """Tests for threshold constants."""
@@ -254,3 +291,285 @@ class TestQualityGateResult:
         )
         assert result.passed is True
         assert result.requires_validation is True
+
+
+def _angle(degrees: float) -> np.ndarray:
+    """Unit vector in the plane at the given angle."""
+    radians = np.radians(degrees)
+    return _normalize([np.cos(radians), np.sin(radians)])
+
+
+class TestSemanticCache:
+    """Tests for the in-process duplicate decision cache."""
+
+    def test_hit_above_threshold(self):
+        """Test a near-identical vector returns its own similarity to the insight."""
+        cache = _SemanticCache()
+        existing = _normalize([1.0, 0.2, 0.0])
+        cache.put("brain_test_v1", _normalize([1.0, 0.0, 0.0]), "insight_1", existing)
+        query = _normalize([1.0, 0.1, 0.0])
+
+        existing_id, similarity = cache.get("brain_test_v1", query)
+
+        assert existing_id == "insight_1"
+        assert similarity == pytest.approx(float(existing @ query))
+
+    def test_miss_below_threshold(self):
+        """Test a dissimilar vector is a miss."""
+        cache = _SemanticCache()
+        cache.put(
+            "brain_test_v1", _normalize([1.0, 0.0, 0.0]), "insight_1", _normalize([1.0, 0.0, 0.0])
+        )
+        assert cache.get("brain_test_v1", _normalize([0.0, 1.0, 0.0])) is None
+
+    def test_near_query_below_duplicate_threshold(self):
+        """Test a query near the cached one but not near the insight is a miss."""
+        cache = _SemanticCache()
+        # Cached query at 0 degrees, insight at +31 (cos 0.857), new query at
+        # -29 (cos 0.875 to the cached query, 0.5 to the insight)
+        cache.put("brain_test_v1", _angle(0), "insight_1", _angle(31))
+        assert cache.get("brain_test_v1", _angle(-29)) is None
+
+    def test_scoped_by_brain(self):
+        """Test entries are never shared across brains."""
+        cache = _SemanticCache()
+        cache.put("brain_test_v1", _normalize([1.0, 0.0]), "insight_1", _normalize([1.0, 0.0]))
+        assert cache.get("brain_other_v1", _normalize([1.0, 0.0])) is None
+
+    def test_expired_entries_dropped(self):
+        """Test entries past their TTL are evicted on lookup."""
+        cache = _SemanticCache(ttl=0.0)
+        cache.put("brain_test_v1", _normalize([1.0, 0.0]), "insight_1", _normalize([1.0, 0.0]))
+        assert cache.get("brain_test_v1", _normalize([1.0, 0.0])) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at maxsize."""
+        cache = _SemanticCache(maxsize=2)
+        cache.put(
+            "brain_test_v1", _normalize([1.0, 0.0, 0.0]), "insight_1", _normalize([1.0, 0.0, 0.0])
+        )
+        cache.put(
+            "brain_test_v1", _normalize([0.0, 1.0, 0.0]), "insight_2", _normalize([0.0, 1.0, 0.0])
+        )
+        cache.get("brain_test_v1", _normalize([1.0, 0.0, 0.0]))
+        cache.put(
+            "brain_test_v1", _normalize([0.0, 0.0, 1.0]), "insight_3", _normalize([0.0, 0.0, 1.0])
+        )
+        assert len(cache) == 2
+        assert cache.get("brain_test_v1", _normalize([0.0, 1.0, 0.0])) is None
+        assert cache.get("brain_test_v1", _normalize([1.0, 0.0, 0.0])) is not None
+
+    def test_normalize_unit_length(self):
+        """Test normalization yields unit-length float32 vectors."""
+        vector = _normalize([3.0, 4.0])
+        assert vector.dtype == np.float32
+        assert np.isclose(np.linalg.norm(vector), 1.0)
+
+
+class TestMaxDot:
+    """Tests for the recent-insight best-match kernel."""
+
+    def test_all_negative_scores(self):
+        """Test the best row is found even when every score is negative."""
+        vectors = np.array([[-1.0, 0.0], [-0.5, 0.0], [-2.0, 0.0]], dtype=np.float32)
+        row, score = _max_dot(vectors, np.array([1.0, 0.0], dtype=np.float32))
+        assert row == 1
+        assert score == pytest.approx(-0.5)
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("sign", [1.0, -1.0], ids=["mixed", "negated"])
+    def test_numba_matches_numpy(self, sign):
+        """Test the JIT kernel agrees with the NumPy fallback."""
+        rng = np.random.default_rng(0)
+        vectors = np.stack([_normalize(v) for v in rng.normal(size=(64, 32))])
+        query = _normalize(rng.normal(size=32)) * np.float32(sign)
+        for candidates in (vectors[:1], vectors):
+            row, score = quality_gates._max_dot_numba(candidates, query)
+            expected_row, expected_score = _max_dot_numpy(candidates, query)
+            assert row == expected_row
+            assert score == pytest.approx(expected_score, abs=1e-5)
+
+
+class TestQdrantClient:
+    """Tests for the per-loop async Qdrant client."""
+
+    def test_loop_change_closes_previous_client(self, monkeypatch):
+        """Test the client from a finished loop is closed when replaced."""
+        monkeypatch.setattr(quality_gates, "_create_qdrant_client", AsyncMock)
+        monkeypatch.setattr(quality_gates, "_qdrant_client", None)
+        monkeypatch.setattr(quality_gates, "_qdrant_client_loop", None)
+
+        async def get_client():
+            client = quality_gates._get_qdrant_client()
+            await asyncio.sleep(0)
+            return client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_not_awaited()
+        assert not quality_gates._closing_clients
+
+
+class TestQualityGateBatch:
+    """Tests for batched quality gate checks."""
+
+    @pytest.fixture
+    def mock_client(self, monkeypatch):
+        client = AsyncMock()
+        monkeypatch.setattr(quality_gates, "_get_qdrant_client", lambda: client)
+        monkeypatch.setattr(
+            quality_gates,
+            "embed_batch",
+            lambda texts, input_type: [[float(i + 1), 1.0] for i in range(len(texts))],
+        )
+        monkeypatch.setattr(quality_gates, "_semantic_cache", _SemanticCache())
+        return client
+
+    def test_confidence_batch_matches_single(self):
+        """Test batch confidence equals per-item confidence."""
+        sources = [
+            SourceMetadata(type="call_transcript", id="call_1", company_name="Acme"),
+            SourceMetadata(type="manual_entry", id="manual_1"),
+        ]
+        assert calculate_confidence_batch(["a", "b"], sources) == [
+            calculate_confidence("a", sources[0]),
+            calculate_confidence("b", sources[1]),
+        ]
+
+    async def test_single_batch_request(self, mock_client):
+        """Test duplicate checks for all candidates go out in one request."""
+        source = SourceMetadata(type="call_transcript", id="call_1")
+        weak_source = SourceMetadata(type="manual_entry", id="manual_1")
+        mock_client.query_batch_points.return_value = [
+            SimpleNamespace(
+                points=[SimpleNamespace(id="existing_1", score=0.93, vector=[1.0, 1.0])]
+            ),
+            SimpleNamespace(points=[]),
+        ]
+        items = [
+            QualityGateItem("first", "pain_point", "medium", source),
+            QualityGateItem("low", "pain_point", "medium", weak_source),
+            QualityGateItem("second", "pain_point", "medium", source),
+        ]
+
+        results = await run_quality_gate_batch("brain_test_v1", items)
+
+        assert mock_client.query_batch_points.call_count == 1
+        requests = mock_client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 2
+        assert all(request.with_vector for request in requests)
+        assert results[0].is_duplicate is True
+        assert results[0].duplicate_id == "existing_1"
+        assert results[1].passed is False
+        assert results[1].is_duplicate is False
+        assert results[2].passed is True
+
+    async def test_exact_match_skips_embedding(self, mock_client, monkeypatch):
+        """Test a remembered insight is matched without embedding or search."""
+
+        def fail_embed(text):
+            raise AssertionError("embedding should be skipped")
+
+        monkeypatch.setattr(quality_gates, "embed_query", fail_embed)
+        remember_insight("brain_test_v1", "Budget approved by CFO", "insight_1", [1.0, 0.0])
+
+        result = await check_duplicate("brain_test_v1", "  budget approved by cfo ")
+
+        assert result == (True, "insight_1", 1.0)
+        mock_client.query_points.assert_not_called()
+
+    async def test_forget_brain_drops_exact_matches(self, mock_client, monkeypatch):
+        """Test forgotten brains fall through to the semantic search."""
+        monkeypatch.setattr(quality_gates, "embed_query", lambda text: [1.0, 0.0])
+        mock_client.query_points.return_value = SimpleNamespace(points=[])
+        remember_insight("brain_test_v1", "Budget approved by CFO", "insight_1", [1.0, 0.0])
+        forget_brain("brain_test_v1")
+
+        result = await check_duplicate("brain_test_v1", "Budget approved by CFO")
+
+        assert result == (False, None, None)
+        mock_client.query_points.assert_awaited_once()
+
+    async def test_exact_matches_expire(self, mock_client, monkeypatch):
+        """Test an expired exact match falls through to the semantic search."""
+        monkeypatch.setattr(quality_gates, "EXACT_MATCH_CACHE_TTL_SECONDS", 0.0)
+        monkeypatch.setattr(quality_gates, "embed_query", lambda text: [1.0, 0.0])
+        mock_client.query_points.return_value = SimpleNamespace(points=[])
+        remember_insight("brain_test_v1", "Budget approved by CFO", "insight_1", [0.0, 1.0])
+
+        result = await check_duplicate("brain_test_v1", "Budget approved by CFO")
+
+        assert result == (False, None, None)
+        mock_client.query_points.assert_awaited_once()
+
+    async def test_embedding_reused_for_repeat_content(self, mock_client, monkeypatch):
+        """Test repeated content is embedded only once."""
+        calls = []
+
+        def fake_embed(text):
+            calls.append(text)
+            return [1.0, 0.0]
+
+        monkeypatch.setattr(quality_gates, "embed_query", fake_embed)
+        mock_client.query_points.return_value = SimpleNamespace(points=[])
+
+        await check_duplicate("brain_test_v1", "Procurement needs three quotes")
+        await check_duplicate("brain_test_v1", "Procurement needs three quotes")
+
+        assert calls == ["Procurement needs three quotes"]
+        assert mock_client.query_points.await_count == 2
+
+    async def test_recent_insight_matched_without_search(self, mock_client, monkeypatch):
+        """Test a near-duplicate of a just-stored insight skips Qdrant."""
+        vectors = {
+            "Buyer wants SOC 2 report": [1.0, 0.0, 0.0],
+            "Buyer asked for the SOC 2 report": [0.95, 0.1, 0.0],
+            "Pricing is too high": [0.0, 0.0, 1.0],
+        }
+        monkeypatch.setattr(quality_gates, "embed_query", lambda text: vectors[text])
+        mock_client.query_points.return_value = SimpleNamespace(points=[])
+
+        await check_duplicate("brain_test_v1", "Buyer wants SOC 2 report")
+        remember_insight("brain_test_v1", "Buyer wants SOC 2 report", "insight_1", [0.9, 0.3, 0.0])
+        mock_client.query_points.reset_mock()
+
+        is_duplicate, existing_id, similarity = await check_duplicate(
+            "brain_test_v1", "Buyer asked for the SOC 2 report"
+        )
+        assert (is_duplicate, existing_id) == (True, "insight_1")
+        assert similarity >= DUPLICATE_SIMILARITY_THRESHOLD
+        mock_client.query_points.assert_not_called()
+
+        assert await check_duplicate("brain_test_v1", "Pricing is too high") == (
+            False,
+            None,
+            None,
+        )
+        mock_client.query_points.assert_awaited_once()
+
+    async def test_recent_insight_scored_against_document_vector(self, mock_client, monkeypatch):
+        """Test the recent-insight buffer scores a query as the Qdrant search would."""
+        # The paraphrase is within the threshold of the stored insight's query
+        # embedding but not of the document embedding it was stored with
+        vectors = {
+            "Buyer wants SOC 2 report": [1.0, 0.0, 0.0],
+            "Buyer needs the SOC 2 report": [0.9, -0.35, 0.0],
+        }
+        document_vector = [0.9, 0.3, 0.0]
+        monkeypatch.setattr(quality_gates, "embed_query", lambda text: vectors[text])
+        mock_client.query_points.return_value = SimpleNamespace(points=[])
+
+        await check_duplicate("brain_test_v1", "Buyer wants SOC 2 report")
+        remember_insight("brain_test_v1", "Buyer wants SOC 2 report", "insight_1", document_vector)
+        mock_client.query_points.reset_mock()
+
+        assert await check_duplicate("brain_test_v1", "Buyer needs the SOC 2 report") == (
+            False,
+            None,
+            None,
+        )
+        mock_client.query_points.assert_awaited_once()
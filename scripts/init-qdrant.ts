@@ -19,10 +19,20 @@ const QDRANT_URL = process.env.QDRANT_URL || "http://localhost:6333";
 const QDRANT_API_KEY = process.env.QDRANT_API_KEY;
 const EMBEDDING_DIM = 1024; // Voyage AI voyage-3.5-lite dimension
 
+// int8 scalar quantization; searches rescore against the original vectors
+const SCALAR_QUANTIZATION = {
+  scalar: {
+    type: "int8" as const,
+    always_ram: true,
+  },
+};
+
 interface CollectionConfig {
   name: string;
   description: string;
   indexes: IndexConfig[];
+  // Keep an int8 copy of vectors in RAM for faster similarity search
+  quantized?: boolean;
 }
 
 interface IndexConfig {
@@ -83,6 +93,7 @@ const COLLECTIONS: CollectionConfig[] = [
   {
     name: "insights",
     description: "Learnings extracted from conversations",
+    quantized: true,
     indexes: [
       { field: "brain_id", type: "keyword" },
       { field: "vertical", type: "keyword" },
@@ -140,6 +151,12 @@ async function initCollections() {
 
       if (exists) {
         console.log(`✓ Collection '${config.name}' already exists`);
+        if (config.quantized) {
+          await client.updateCollection(config.name, {
+            quantization_config: SCALAR_QUANTIZATION,
+          });
+          console.log(`  ✓ Scalar quantization enabled: ${config.name}`);
+        }
       } else {
         // Create collection with 1024-dimension vectors
         await client.createCollection(config.name, {
@@ -147,6 +164,7 @@ async function initCollections() {
             size: EMBEDDING_DIM,
             distance: "Cosine",
           },
+          ...(config.quantized ? { quantization_config: SCALAR_QUANTIZATION } : {}),
         });
         console.log(`✓ Created collection: ${config.name}`);
       }